@@ -0,0 +1,6 @@
+"""Shared helpers reused across Advent of Code 2025 day solutions."""
+
+from .grid import Grid
+from .union_find import UnionFind
+
+__all__ = ["Grid", "UnionFind"]
@@ -0,0 +1,51 @@
+"""Operand arithmetic shared by the worksheet days, safe to run in worker processes.
+
+Day directories (day-06, ...) are not importable module names, so a function
+defined there cannot be unpickled by a process started with the "spawn" or
+"forkserver" method. Process-pool workers therefore live here, in an
+installed package every child process can import.
+"""
+
+from collections.abc import Sequence
+
+
+def product_tree(operands: Sequence[int]) -> int:
+    """Multiply operands pairwise in a balanced tree instead of a left fold.
+
+    Big-integer multiplication is fastest when both factors have similar
+    sizes, so combining neighbours level by level beats accumulating one
+    ever-growing product when operands are large.
+
+    Example:
+        >>> product_tree([2, 3, 4, 5, 6])
+        720
+        >>> product_tree([])
+        1
+    """
+    level = list(operands)
+    if not level:
+        return 1
+    while len(level) > 1:
+        paired = [level[i] * level[i + 1] for i in range(0, len(level) - 1, 2)]
+        if len(level) % 2:
+            paired.append(level[-1])
+        level = paired
+    return level[0]
+
+
+def apply_operation(operands: Sequence[int], operation: str) -> int:
+    """Apply '+' (sum) or '*' (product_tree) to all operands.
+
+    Raises:
+        ValueError: If operation is not '+' or '*'
+    """
+    if operation == "+":
+        return sum(operands)
+    if operation == "*":
+        return product_tree(operands)
+    raise ValueError(f"Unknown operation: {operation}")
+
+
+def apply_operations(batch: Sequence[tuple[Sequence[int], str]]) -> list[int]:
+    """Process-pool worker: apply_operation to each (operands, operation) pair."""
+    return [apply_operation(operands, operation) for operands, operation in batch]
@@ -0,0 +1,99 @@
+"""Compact character grid shared by the grid-based days.
+
+A Grid stores every cell as one byte of a single bytearray, surrounded by a
+one-cell border of fill bytes. Cells are addressed by a flat index, so the
+8 neighbors of any in-grid cell are fixed index offsets that never need a
+bounds check. This costs 1 byte per cell instead of the ~100 bytes of a
+tuple-keyed dict or set entry.
+"""
+
+import numpy as np
+
+# Direction offsets for 8 adjacent positions (NW, N, NE, W, E, SW, S, SE)
+NEIGHBOR_DIRECTIONS: tuple[tuple[int, int], ...] = (
+    (-1, -1),
+    (-1, 0),
+    (-1, 1),
+    (0, -1),
+    (0, 1),
+    (1, -1),
+    (1, 0),
+    (1, 1),
+)
+
+
+class Grid:
+    """Rectangular ASCII grid backed by a padded, flat bytearray.
+
+    Rows shorter than the widest row are right-filled with the fill character,
+    which also forms the border. Flat index of (row, col) is
+    (row + 1) * stride + col + 1, where stride = width + 2.
+
+    Example:
+        >>> grid = Grid(["@.", ".@"])
+        >>> grid[1, 1], grid[-1, 0]
+        ('@', '.')
+        >>> grid.count_neighbors(grid.index(0, 0), "@")
+        1
+    """
+
+    __slots__ = ("height", "width", "stride", "fill", "cells", "neighbor_offsets")
+
+    def __init__(self, rows: list[str], fill: str = ".") -> None:
+        """Build the grid from row strings.
+
+        Args:
+            rows: Grid rows (ASCII characters only)
+            fill: Character used for the border and for short-row filling
+        """
+        self.height = len(rows)
+        self.width = max((len(row) for row in rows), default=0)
+        self.stride = self.width + 2
+        self.fill = fill
+        self.cells = bytearray(fill.encode("ascii") * (self.stride * (self.height + 2)))
+        for row, row_str in enumerate(rows):
+            start = (row + 1) * self.stride + 1
+            self.cells[start : start + len(row_str)] = row_str.encode("ascii")
+        self.neighbor_offsets: tuple[int, ...] = tuple(
+            dr * self.stride + dc for dr, dc in NEIGHBOR_DIRECTIONS
+        )
+
+    def index(self, row: int, col: int) -> int:
+        """Return the flat index of (row, col); (-1, -1) maps onto the border."""
+        return (row + 1) * self.stride + col + 1
+
+    def position(self, index: int) -> tuple[int, int]:
+        """Return the (row, col) of a flat index."""
+        row, col = divmod(index, self.stride)
+        return row - 1, col - 1
+
+    def in_bounds(self, row: int, col: int) -> bool:
+        """Check if (row, col) lies inside the grid (border excluded)."""
+        return 0 <= row < self.height and 0 <= col < self.width
+
+    def __getitem__(self, position: tuple[int, int]) -> str:
+        """Return the character at (row, col), or the fill character when out of bounds."""
+        row, col = position
+        if not self.in_bounds(row, col):
+            return self.fill
+        return chr(self.cells[self.index(row, col)])
+
+    def indices_of(self, char: str) -> list[int]:
+        """Return the flat indices of every cell holding char (other than fill), row-major."""
+        target = ord(char)
+        return [index for index, value in enumerate(self.cells) if value == target]
+
+    def find(self, char: str) -> tuple[int, int] | None:
+        """Return the (row, col) of the first cell holding char (other than fill), or None."""
+        index = self.cells.find(char.encode("ascii"))
+        return None if index < 0 else self.position(index)
+
+    def count_neighbors(self, index: int, char: str) -> int:
+        """Count the 8 neighbors of an in-grid flat index that hold char."""
+        target = ord(char)
+        cells = self.cells
+        return sum(cells[index + offset] == target for offset in self.neighbor_offsets)
+
+    def to_array(self) -> np.ndarray:
+        """Return a zero-copy uint8 view of shape (height + 2, stride), border included."""
+        return np.frombuffer(self.cells, dtype=np.uint8).reshape(self.height + 2, self.stride)
@@ -0,0 +1,161 @@
+"""Array-backed disjoint-set forest shared by the graph-based days.
+
+Parents and component sizes live in two array('i') buffers: scalar find and
+union work on them at Python list speed, while union_many views the same
+buffers as NumPy int32 arrays (zero-copy) to merge whole batches of pairs.
+find is iterative, so long parent chains never hit the recursion limit.
+"""
+
+import heapq
+from array import array
+from collections.abc import Sequence
+
+import numpy as np
+from scipy.sparse import coo_matrix
+from scipy.sparse.csgraph import connected_components, minimum_spanning_tree
+
+
+class UnionFind:
+    """Union-Find with path compression and union-by-size.
+
+    Example:
+        >>> uf = UnionFind(5)
+        >>> uf.union(0, 1), uf.union(1, 0)
+        (True, False)
+        >>> uf.union_many([2, 3, 0], [3, 1, 2]).tolist()
+        [True, True, False]
+        >>> uf.component_size(3), uf.num_components
+        (4, 2)
+    """
+
+    __slots__ = ("parent", "size", "num_components")
+
+    def __init__(self, n: int) -> None:
+        """Initialize n singleton components.
+
+        Args:
+            n: Number of elements (at most 2**31 - 1)
+        """
+        self.parent = array("i", range(n))  # Each element is its own parent initially
+        self.size = array("i", [1]) * n  # Component size, valid at roots only
+        self.num_components = n  # Track number of disjoint components
+
+    def __len__(self) -> int:
+        return len(self.parent)
+
+    def find(self, x: int) -> int:
+        """Find root of element x, pointing every node on the path at the root."""
+        parent = self.parent
+        root = x
+        while parent[root] != root:
+            root = parent[root]
+        while parent[x] != root:
+            parent[x], x = root, parent[x]
+        return root
+
+    def union(self, x: int, y: int) -> bool:
+        """Unite the components of x and y, attaching the smaller under the larger.
+
+        Returns:
+            True if components were merged, False if already in same component
+        """
+        xroot = self.find(x)
+        yroot = self.find(y)
+        if xroot == yroot:
+            return False
+        size = self.size
+        if size[xroot] < size[yroot]:
+            xroot, yroot = yroot, xroot
+        self.parent[yroot] = xroot
+        size[xroot] += size[yroot]
+        self.num_components -= 1
+        return True
+
+    def union_many(
+        self, a: Sequence[int] | np.ndarray, b: Sequence[int] | np.ndarray
+    ) -> np.ndarray:
+        """Apply union(a[i], b[i]) for every i in order, as one vectorized batch.
+
+        Pair i merges iff a[i] and b[i] are still in different components after
+        pairs 0..i-1, which is exactly Kruskal's rule with weight i. So the
+        merging pairs are the minimum spanning forest of the component graph
+        weighted by position, computed by scipy in C. Each merged group of
+        components is then attached to its largest member.
+
+        Args:
+            a: First element of each pair
+            b: Second element of each pair
+
+        Returns:
+            Boolean array, True where the pair merged two components
+        """
+        a = np.asarray(a, dtype=np.int64)
+        b = np.asarray(b, dtype=np.int64)
+        merged = np.zeros(len(a), dtype=bool)
+        if not len(a):
+            return merged
+        parent = np.frombuffer(self.parent, dtype=np.int32)
+        size = np.frombuffer(self.size, dtype=np.int32)
+        self._compress(parent)
+
+        root_a, root_b = parent[a], parent[b]
+        low, high = np.minimum(root_a, root_b), np.maximum(root_a, root_b)
+        # Only the first pair joining two given components can merge them
+        crossing = np.flatnonzero(low != high)
+        keys = low[crossing].astype(np.int64) * len(parent) + high[crossing]
+        crossing = crossing[np.sort(np.unique(keys, return_index=True)[1])]
+        if not len(crossing):
+            return merged
+
+        roots, ends = np.unique(
+            np.concatenate((low[crossing], high[crossing])), return_inverse=True
+        )
+        ends = ends.reshape(2, -1)
+        graph = coo_matrix(
+            (crossing + 1.0, (ends[0], ends[1])), shape=(len(roots), len(roots))
+        ).tocsr()
+        forest = minimum_spanning_tree(graph).tocoo()
+        merged[forest.data.astype(np.int64) - 1] = True
+
+        _, labels = connected_components(forest, directed=False)
+        # Largest root of each group first; it becomes the group's new root
+        order = np.lexsort((-size[roots], labels))
+        first = np.flatnonzero(np.diff(labels[order], prepend=-1))
+        new_root = roots[order[first]]
+        group_sizes = np.bincount(labels, weights=size[roots]).astype(np.int32)
+        parent[roots] = new_root[labels]
+        size[new_root] = group_sizes
+        self.num_components -= int(merged.sum())
+        return merged
+
+    @staticmethod
+    def _compress(parent: np.ndarray) -> None:
+        """Point every element directly at its root by pointer jumping."""
+        while True:
+            grandparent = parent[parent]
+            if np.array_equal(grandparent, parent):
+                return
+            parent[:] = grandparent
+
+    def component_size(self, x: int) -> int:
+        """Return the size of the component containing x."""
+        return self.size[self.find(x)]
+
+    def largest_sizes(self, count: int = 3) -> list[int]:
+        """Return the count largest component sizes in descending order.
+
+        Uses heapq.nlargest over root sizes: O(n log count) instead of a full sort.
+        """
+        roots = (x for x, parent in enumerate(self.parent) if x == parent)
+        return heapq.nlargest(count, (self.size[root] for root in roots))
+
+    def components(self) -> dict[int, set[int]]:
+        """Group all elements by root: root -> set of member IDs."""
+        groups: dict[int, set[int]] = {}
+        for x in range(len(self.parent)):
+            groups.setdefault(self.find(x), set()).add(x)
+        return groups
+
+    def is_fully_connected(self) -> bool:
+        """Check if all elements are in a single component."""
+        return self.num_components == 1
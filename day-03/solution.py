@@ -5,6 +5,7 @@ Calculates maximum joltage from battery banks.
 """
 
 from pathlib import Path
+from typing import TextIO
 
 
 def parse_input(input_text: str) -> list[str]:
@@ -124,6 +125,57 @@ def solve_part2(input_text: str) -> int:
     return total
 
 
+def solve_stream(fp: TextIO, k: int = 12, chunk_size: int = 65536) -> int:
+    """
+    Sum the maximum k-digit joltage of every bank read incrementally from fp.
+
+    Banks are consumed in fixed-size chunks, so a single bank line may be
+    arbitrarily long. The monotonic stack needs the remaining bank length,
+    which is unknown while streaming, so each bank instead keeps best[j]:
+    the largest j-digit subsequence of the digits seen so far. A new digit d
+    updates best[j] = max(best[j], best[j - 1] * 10 + d) for j from k down
+    to 1, giving O(k) time per digit and O(k) memory per bank.
+
+    Args:
+        fp (TextIO): Readable text stream with one battery bank per line.
+        k (int): Number of digits to select per bank (default 12).
+        chunk_size (int): Number of characters read per call to fp.read.
+
+    Returns:
+        int: Total output joltage (sum of all maximum k-digit numbers).
+
+    Raises:
+        ValueError: If a bank has fewer than k digits.
+    """
+    total = 0
+    best = [0] * (k + 1)
+    seen = 0
+
+    def finish_bank() -> int:
+        if seen < k:
+            raise ValueError(f"Bank has {seen} digits but need {k}")
+        return best[k]
+
+    while chunk := fp.read(chunk_size):
+        for char in chunk:
+            if "0" <= char <= "9":
+                digit = ord(char) - 48
+                # Descend so best[j - 1] still refers to the previous prefix
+                for j in range(min(seen + 1, k), 0, -1):
+                    candidate = best[j - 1] * 10 + digit
+                    if candidate > best[j]:
+                        best[j] = candidate
+                seen += 1
+            elif char == "\n" and seen:
+                total += finish_bank()
+                best = [0] * (k + 1)
+                seen = 0
+
+    if seen:
+        total += finish_bank()
+    return total
+
+
 def main() -> None:
     """
     Entry point for running solution with input.txt.
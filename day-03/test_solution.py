@@ -6,6 +6,7 @@ try:
         select_max_k_digits,
         solve_part1,
         solve_part2,
+        solve_stream,
     )
 except ImportError:
     max_joltage = None
@@ -13,6 +14,7 @@ except ImportError:
     select_max_k_digits = None
     solve_part1 = None
     solve_part2 = None
+    solve_stream = None
 
 
 # T005 [P] [US1] test_max_joltage()
@@ -100,3 +102,41 @@ def test_solve_part2():
     result = solve_part2(input_text)
     # 987654321111 + 811111111119 + 434234234278 + 888911112111 = 3121910778619
     assert result == 3121910778619
+
+
+# --- Streaming Tests ---
+
+
+def test_solve_stream_matches_solve_part2():
+    """Test streaming solver against the in-memory Part 2 result."""
+    import io
+
+    input_text = "987654321111111\n811111111111119\n234234234234278\n818181911112111\n"
+    assert solve_stream(io.StringIO(input_text)) == solve_part2(input_text)
+
+
+def test_solve_stream_small_chunks():
+    """Test banks split across chunk boundaries, blank lines and CRLF endings."""
+    import io
+
+    input_text = "\r\n987654321111111\r\n\r\n818181911112111"
+    assert solve_stream(io.StringIO(input_text), chunk_size=4) == 987654321111 + 888911112111
+    assert solve_stream(io.StringIO(input_text), k=2, chunk_size=1) == 98 + 92
+
+
+def test_solve_stream_long_bank():
+    """Test a single bank much longer than the chunk size."""
+    import io
+
+    bank = "1234567890" * 500
+    assert solve_stream(io.StringIO(bank), chunk_size=7) == int(select_max_k_digits(bank))
+
+
+def test_solve_stream_error():
+    """Test error handling for streamed banks with <k digits."""
+    import io
+
+    import pytest
+
+    with pytest.raises(ValueError):
+        solve_stream(io.StringIO("12345\n"))
@@ -0,0 +1,44 @@
+"""Benchmark round-based vs worklist Part 2 removal on random grids.
+
+Usage (from the day-04 directory):
+    uv run python benchmark.py [size ...]
+"""
+
+import random
+import sys
+import time
+
+from solution import solve_part2, solve_part2_worklist
+
+
+def random_grid(size: int, density: float = 0.7, seed: int = 2025) -> str:
+    """Build a size x size grid where each cell holds a roll with given density."""
+    rng = random.Random(seed)
+    return "\n".join(
+        "".join("@" if rng.random() < density else "." for _ in range(size)) for _ in range(size)
+    )
+
+
+def time_call(func, input_data: str) -> tuple[int, float]:
+    """Run func once and return (result, elapsed seconds)."""
+    start = time.perf_counter()
+    result = func(input_data)
+    return result, time.perf_counter() - start
+
+
+def main() -> None:
+    sizes = [int(arg) for arg in sys.argv[1:]] or [100, 300, 1000]
+    print(f"{'size':>6} {'removed':>10} {'rounds (s)':>12} {'worklist (s)':>13} {'speedup':>8}")
+    for size in sizes:
+        input_data = random_grid(size)
+        rounds_result, rounds_time = time_call(solve_part2, input_data)
+        worklist_result, worklist_time = time_call(solve_part2_worklist, input_data)
+        assert rounds_result == worklist_result, (rounds_result, worklist_result)
+        print(
+            f"{size:>6} {worklist_result:>10} {rounds_time:>12.3f} {worklist_time:>13.3f} "
+            f"{rounds_time / worklist_time:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
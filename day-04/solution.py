@@ -9,8 +9,14 @@ Functions:
     - count_adjacent_rolls: Count neighbors
     - is_accessible: Accessibility logic
     - solve_part1: Main solution
+    - solve_part2: Round-based iterative removal
+    - solve_part2_worklist: Linear-time queue-driven removal
 """
 
+from collections import deque
+
+from common.grid import Grid
+
 # Direction offsets for 8 adjacent positions
 DIRECTIONS: list[tuple[int, int]] = [
     (-1, -1),
@@ -139,63 +145,105 @@ def solve_part1(input_data: str) -> int:
 
 
 # --- Part 2: Iterative Removal Algorithm ---
-from typing import Dict, Set, Tuple
-
-
-def build_rolltracker_and_buckets(
-    grid: list[str],
-) -> Tuple[Dict[Tuple[int, int], int], Dict[int, Set[Tuple[int, int]]]]:
+def build_rolltracker_and_buckets(grid: Grid) -> tuple[bytearray, list[set[int]]]:
     """
-    Build rolltracker (pos -> neighbor count) and bucketed sets (count -> set of positions).
+    Build rolltracker (flat index -> neighbor count) and bucketed sets (count -> flat indices).
+
+    Counts live in one bytearray parallel to grid.cells and buckets hold plain
+    int indices, so no (row, col) tuples are allocated per roll.
     Returns (rolltracker, buckets)
     """
-    rolltracker: Dict[Tuple[int, int], int] = {}
-    buckets: Dict[int, Set[Tuple[int, int]]] = {i: set() for i in range(9)}
-    for row, row_str in enumerate(grid):
-        for col, val in enumerate(row_str):
-            if val == "@":
-                count = count_adjacent_rolls(grid, row, col)
-                rolltracker[(row, col)] = count
-                buckets[count].add((row, col))
+    rolltracker = bytearray(len(grid.cells))
+    buckets: list[set[int]] = [set() for _ in range(9)]
+    for idx in grid.indices_of("@"):
+        count = grid.count_neighbors(idx, "@")
+        rolltracker[idx] = count
+        buckets[count].add(idx)
     return rolltracker, buckets
 
 
 def solve_part2(input_data: str) -> int:
     """
     Solve Day 4 Part 2: Iteratively remove accessible rolls and count total removed.
+
+    Each round removes every roll with fewer than 4 neighbors at once, then
+    moves its remaining neighbors one bucket down.
     Returns total removed rolls.
     """
-    grid = parse_grid(input_data)
-    if not grid:
-        return 0
+    grid = Grid(parse_grid(input_data))
+    cells, offsets = grid.cells, grid.neighbor_offsets
+    roll, empty = ord("@"), ord(".")
     rolltracker, buckets = build_rolltracker_and_buckets(grid)
     total_removed = 0
     while buckets[0] or buckets[1] or buckets[2] or buckets[3]:
         accessible = buckets[0] | buckets[1] | buckets[2] | buckets[3]
         # Remove accessible rolls
-        for pos in accessible:
-            # Remove from correct bucket
-            for count in range(4):
-                if pos in buckets[count]:
-                    buckets[count].remove(pos)
-                    break
-            if pos in rolltracker:
-                del rolltracker[pos]
-            # Update neighbors
-            row, col = pos
-            for dr, dc in DIRECTIONS:
-                neighbor = (row + dr, col + dc)
-                for old_count in range(1, 9):
-                    if neighbor in buckets[old_count]:
-                        buckets[old_count].remove(neighbor)
-                        buckets[old_count - 1].add(neighbor)
-                        if neighbor in rolltracker:
-                            rolltracker[neighbor] -= 1
-                        break
+        for count in range(4):
+            buckets[count].clear()
+        for idx in accessible:
+            cells[idx] = empty
+        # Update remaining neighbors
+        for idx in accessible:
+            for off in offsets:
+                neighbor = idx + off
+                if cells[neighbor] == roll:
+                    old_count = rolltracker[neighbor]
+                    buckets[old_count].remove(neighbor)
+                    buckets[old_count - 1].add(neighbor)
+                    rolltracker[neighbor] = old_count - 1
         total_removed += len(accessible)
     return total_removed
 
 
+def solve_part2_worklist(input_data: str) -> int:
+    """
+    Solve Day 4 Part 2 by queue-driven peeling (as in k-core decomposition).
+
+    The grid is held in a padded Grid, so neighbors are fixed flat-index
+    offsets with no bounds checks, and neighbor counts live in a flat
+    bytearray. A roll enters the FIFO once, either initially (< 4 neighbors)
+    or when a removal drops its count from 4 to 3. Each removal decrements
+    at most 8 counts, so the whole peel runs in linear time.
+
+    Removing a roll only ever lowers neighbor counts, so the set of removed
+    rolls does not depend on removal order and matches solve_part2.
+
+    Example:
+        >>> solve_part2_worklist("@@@\n@@@\n@@@")
+        9
+
+    Args:
+        input_data: Multiline string containing grid
+
+    Returns:
+        Total number of removed rolls
+    """
+    grid = Grid(parse_grid(input_data))
+    cells, offsets = grid.cells, grid.neighbor_offsets
+    roll, empty = ord("@"), ord(".")
+
+    counts = bytearray(len(cells))
+    queue: deque[int] = deque()
+    for idx in grid.indices_of("@"):
+        count = grid.count_neighbors(idx, "@")
+        counts[idx] = count
+        if is_accessible(count):
+            queue.append(idx)
+
+    total_removed = 0
+    while queue:
+        idx = queue.popleft()
+        cells[idx] = empty
+        total_removed += 1
+        for off in offsets:
+            neighbor = idx + off
+            if cells[neighbor] == roll:
+                counts[neighbor] -= 1
+                if counts[neighbor] == 3:
+                    queue.append(neighbor)
+    return total_removed
+
+
 if __name__ == "__main__":
     # Read input and solve both parts
     with open("day-04/input.txt") as f:
@@ -7,6 +7,7 @@ from .solution import (
     parse_grid,
     solve_part1,
     solve_part2,
+    solve_part2_worklist,
 )
 
 
@@ -158,3 +159,32 @@ def test_all_accessible():
 @.@"""
     result = solve_part1(input_data)
     assert result == 4, f"Expected 4 accessible rolls, got {result}"
+
+
+def test_example_grid_part2_worklist():
+    """Test worklist peeling on the example expecting 43 removed rolls."""
+    input_data = """..@@.@@@@.
+@@@.@.@.@@
+@@@@@.@.@@
+@.@@@@..@.
+@@.@@@@.@@
+.@@@@@@@.@
+.@.@.@.@@@
+@.@@@.@@@@
+.@@@@@@@@.
+@.@.@@@.@."""
+    assert solve_part2_worklist(input_data) == 43
+    assert solve_part2_worklist("") == 0
+
+
+def test_part2_worklist_matches_rounds():
+    """Test worklist peeling matches round-based removal on random grids."""
+    import random
+
+    rng = random.Random(4)
+    for _ in range(20):
+        size = rng.randint(1, 15)
+        input_data = "\n".join(
+            "".join(rng.choice("@@@.") for _ in range(size)) for _ in range(size)
+        )
+        assert solve_part2_worklist(input_data) == solve_part2(input_data)
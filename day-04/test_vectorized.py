@@ -0,0 +1,75 @@
+"""Tests for the Day 4 vectorized NumPy engine."""
+
+from .solution import count_adjacent_rolls, parse_grid, solve_part1, solve_part2
+from .vectorized import (
+    grid_to_array,
+    neighbor_counts,
+    removal_rounds,
+    solve_part1_vectorized,
+    solve_part2_vectorized,
+)
+
+EXAMPLE = """..@@.@@@@.
+@@@.@.@.@@
+@@@@@.@.@@
+@.@@@@..@.
+@@.@@@@.@@
+.@@@@@@@.@
+.@.@.@.@@@
+@.@@@.@@@@
+.@@@@@@@@.
+@.@.@@@.@."""
+
+
+def test_grid_to_array_padding():
+    """Test the roll array is padded with empty cells on every side."""
+    padded = grid_to_array(["@.", ".@"])
+    assert padded.shape == (4, 4)
+    assert padded.sum() == 2
+    assert padded[1, 1] and padded[2, 2]
+    assert not padded[0].any() and not padded[-1].any()
+    assert not padded[:, 0].any() and not padded[:, -1].any()
+
+
+def test_grid_to_array_empty():
+    """Test empty grid converts to an all-padding array."""
+    assert grid_to_array([]).shape == (2, 2)
+    assert solve_part1_vectorized("") == 0
+
+
+def test_neighbor_counts_match_scalar():
+    """Test vectorized counts match count_adjacent_rolls for every cell."""
+    grid = parse_grid(EXAMPLE)
+    counts = neighbor_counts(grid_to_array(grid))
+    for r, row in enumerate(grid):
+        for c in range(len(row)):
+            assert counts[r, c] == count_adjacent_rolls(grid, r, c)
+
+
+def test_solve_part1_vectorized_example():
+    """Test with provided example expecting 13 accessible rolls."""
+    assert solve_part1_vectorized(EXAMPLE) == 13
+    assert solve_part1_vectorized("@") == 1
+    assert solve_part1_vectorized("@@@\n@@@\n@@@") == solve_part1("@@@\n@@@\n@@@")
+
+
+def test_removal_rounds_example():
+    """Test per-round removals start with Part 1's count and sum to 43."""
+    padded = grid_to_array(parse_grid(EXAMPLE))
+    rounds = removal_rounds(padded)
+    assert rounds[0] == 13
+    assert sum(rounds) == 43
+    assert all(removed > 0 for removed in rounds)
+    assert padded.sum() == EXAMPLE.count("@")  # input left untouched
+
+
+def test_removal_rounds_empty_and_stable():
+    """Test no rounds are recorded when nothing can be removed."""
+    assert removal_rounds(grid_to_array([])) == []
+    assert removal_rounds(grid_to_array(["..."])) == []
+
+
+def test_solve_part2_vectorized_matches_solution():
+    """Test vectorized Part 2 against the round-based solution."""
+    assert solve_part2_vectorized(EXAMPLE) == 43
+    assert solve_part2_vectorized("@@@\n@@@\n@@@") == solve_part2("@@@\n@@@\n@@@")
@@ -0,0 +1,128 @@
+"""
+Day 4: Vectorized NumPy engine for paper roll neighbor counting
+
+Converts the parsed grid into a zero-padded boolean array so that the
+neighbor counts of every cell come from eight shifted array additions
+instead of eight bounds-checked lookups per cell.
+
+Functions:
+    - grid_to_array: Parse grid rows into a padded boolean roll array
+    - neighbor_counts: Count adjacent rolls for every cell at once
+    - solve_part1_vectorized: Vectorized Part 1 solution
+    - removal_rounds: Per-round removal counts of the iterative removal
+    - solve_part2_vectorized: Vectorized Part 2 solution
+"""
+
+import numpy as np
+
+from common.grid import Grid
+
+from .solution import DIRECTIONS, parse_grid
+
+ROLL = ord("@")
+
+
+def grid_to_array(grid: list[str]) -> np.ndarray:
+    """
+    Convert grid rows into a boolean roll array padded by one empty cell per side.
+
+    Example:
+        >>> grid_to_array(["@."]).astype(int).tolist()
+        [[0, 0, 0, 0], [0, 1, 0, 0], [0, 0, 0, 0]]
+
+    Args:
+        grid: Grid rows as returned by parse_grid
+
+    Returns:
+        Boolean array of shape (rows + 2, cols + 2), True where a roll sits
+    """
+    return Grid(grid).to_array() == ROLL
+
+
+def neighbor_counts(padded: np.ndarray) -> np.ndarray:
+    """
+    Count paper rolls in the 8 adjacent positions of every cell.
+
+    The padding border stands in for out-of-bounds neighbors, so each
+    direction is a single shifted slice added into the result.
+
+    Example:
+        >>> int(neighbor_counts(grid_to_array(["@@@", "@@@", "@@@"]))[1, 1])
+        8
+
+    Args:
+        padded: Padded boolean roll array from grid_to_array
+
+    Returns:
+        uint8 array of shape (rows, cols) with neighbor counts (0-8)
+    """
+    rows, cols = padded.shape[0] - 2, padded.shape[1] - 2
+    counts = np.zeros((rows, cols), dtype=np.uint8)
+    for dr, dc in DIRECTIONS:
+        counts += padded[1 + dr : 1 + dr + rows, 1 + dc : 1 + dc + cols]
+    return counts
+
+
+def solve_part1_vectorized(input_data: str) -> int:
+    """
+    Solve Day 4 Part 1 with NumPy: count rolls with fewer than 4 neighbors.
+
+    Example:
+        >>> solve_part1_vectorized("@.@\\n...\\n@.@")
+        4
+
+    Args:
+        input_data: Multiline string containing grid
+
+    Returns:
+        Count of accessible paper rolls
+    """
+    padded = grid_to_array(parse_grid(input_data))
+    rolls = padded[1:-1, 1:-1]
+    return int(np.count_nonzero(rolls & (neighbor_counts(padded) < 4)))
+
+
+def removal_rounds(padded: np.ndarray) -> list[int]:
+    """
+    Simulate the Part 2 removal round by round and record rolls removed per round.
+
+    Each round recomputes all neighbor counts, masks the accessible rolls
+    (< 4 neighbors) and clears them together, matching solve_part2's rounds.
+
+    Example:
+        >>> removal_rounds(grid_to_array(["@@@", "@@@", "@@@"]))
+        [4, 4, 1]
+
+    Args:
+        padded: Padded boolean roll array from grid_to_array (left unmodified)
+
+    Returns:
+        Number of rolls removed in each round, in order; empty if none removable
+    """
+    padded = padded.copy()
+    rolls = padded[1:-1, 1:-1]
+    removed_per_round: list[int] = []
+    while True:
+        removable = rolls & (neighbor_counts(padded) < 4)
+        removed = int(np.count_nonzero(removable))
+        if not removed:
+            return removed_per_round
+        rolls &= ~removable
+        removed_per_round.append(removed)
+
+
+def solve_part2_vectorized(input_data: str) -> int:
+    """
+    Solve Day 4 Part 2 with NumPy: total rolls removed over all rounds.
+
+    Example:
+        >>> solve_part2_vectorized("@@@\\n@@@\\n@@@")
+        9
+
+    Args:
+        input_data: Multiline string containing grid
+
+    Returns:
+        Total number of removed rolls
+    """
+    return sum(removal_rounds(grid_to_array(parse_grid(input_data))))
@@ -1,7 +1,16 @@
+import heapq
+import tempfile
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass
+from itertools import chain, islice
+from pathlib import Path
+from typing import TextIO
 
+import numpy as np
 
-@dataclass
+
+@dataclass(slots=True)
 class FreshRange:
     start: int
     end: int
@@ -11,14 +20,61 @@ class FreshRange:
             raise ValueError(f"Invalid FreshRange: start ({self.start}) > end ({self.end})")
 
 
-def merge_ranges(ranges: list[FreshRange]) -> list[tuple[int, int]]:
+class FreshRangeArray:
+    """
+    Struct-of-arrays collection of inclusive fresh ranges.
+
+    Starts and ends live in two contiguous int64 arrays (16 bytes per range)
+    and are validated in one vectorized pass instead of one __post_init__
+    call per range. Indexing and iteration yield FreshRange objects.
+    """
+
+    __slots__ = ("starts", "ends")
+
+    def __init__(self, starts: Iterable[int] | np.ndarray, ends: Iterable[int] | np.ndarray):
+        """
+        Raises:
+            ValueError: If starts and ends differ in length or any start > end
+        """
+        self.starts = np.asarray(starts, dtype=np.int64)
+        self.ends = np.asarray(ends, dtype=np.int64)
+        if self.starts.shape != self.ends.shape or self.starts.ndim != 1:
+            raise ValueError("FreshRangeArray starts and ends must be 1-D arrays of equal length")
+        invalid = self.starts > self.ends
+        if invalid.any():
+            i = int(np.argmax(invalid))
+            raise ValueError(f"Invalid FreshRange: start ({self.starts[i]}) > end ({self.ends[i]})")
+
+    @classmethod
+    def from_ranges(cls, ranges: Iterable[FreshRange]) -> "FreshRangeArray":
+        """Pack FreshRange objects into a FreshRangeArray."""
+        ranges = list(ranges)
+        return cls([r.start for r in ranges], [r.end for r in ranges])
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def __getitem__(self, i: int) -> FreshRange:
+        return FreshRange(int(self.starts[i]), int(self.ends[i]))
+
+    def __iter__(self) -> Iterator[FreshRange]:
+        return (
+            FreshRange(s, e) for s, e in zip(self.starts.tolist(), self.ends.tolist(), strict=True)
+        )
+
+
+def merge_ranges(ranges: list[FreshRange] | FreshRangeArray) -> list[tuple[int, int]]:
     """
     Merge overlapping and adjacent FreshRange intervals into sorted, disjoint
     list of (start, end) tuples. Runs in O(R log R) time where R is the number
-    of ranges.
+    of ranges. A FreshRangeArray is sorted and merged with vectorized NumPy.
     """
-    if not ranges:
+    if not len(ranges):
         return []
+    if isinstance(ranges, FreshRangeArray):
+        order = np.argsort(ranges.starts, kind="stable")
+        pairs = np.column_stack((ranges.starts[order], ranges.ends[order]))
+        return list(map(tuple, _coalesce_sorted(pairs).tolist()))
     # Sort ranges by start
     sorted_ranges = sorted(ranges, key=lambda r: r.start)
     merged = []
@@ -34,6 +90,111 @@ def merge_ranges(ranges: list[FreshRange]) -> list[tuple[int, int]]:
     return merged
 
 
+def _coalesce_sorted(pairs: np.ndarray) -> np.ndarray:
+    """
+    Merge an (n, 2) int64 array of (start, end) pairs, sorted by start, into
+    disjoint, non-adjacent intervals using a running maximum of the ends.
+    """
+    if not len(pairs):
+        return pairs
+    starts = pairs[:, 0]
+    reach = np.maximum.accumulate(pairs[:, 1])
+    # A new interval begins wherever a start lies beyond everything seen so far (+1).
+    # reach + 1 only counts where start > reach, so it cannot wrap at int64 max.
+    beyond = starts[1:] > reach[:-1]
+    first = np.flatnonzero(np.r_[True, beyond & (starts[1:] != reach[:-1] + 1)])
+    last = np.r_[first[1:] - 1, len(pairs) - 1]
+    return np.column_stack((starts[first], reach[last]))
+
+
+def _sorted_run(pairs: list[tuple[int, int]]) -> np.ndarray:
+    """Validate a batch of (start, end) pairs, sort it by start and coalesce it."""
+    run = np.array(pairs, dtype=np.int64).reshape(-1, 2)
+    if np.any(run[:, 0] > run[:, 1]):
+        bad = run[np.argmax(run[:, 0] > run[:, 1])]
+        raise ValueError(f"Invalid FreshRange: start ({bad[0]}) > end ({bad[1]})")
+    return _coalesce_sorted(run[np.argsort(run[:, 0], kind="stable")])
+
+
+def _read_run(path: Path, chunk_rows: int) -> Iterator[tuple[int, int]]:
+    """Yield (start, end) pairs from a spilled run file, reading chunk_rows pairs at a time.
+
+    Only the current int64 chunk is held; pairs are converted to Python ints
+    one at a time as the merge consumes them.
+    """
+    with open(path, "rb", buffering=0) as f:
+        while (chunk := np.fromfile(f, dtype=np.int64, count=2 * chunk_rows)).size:
+            yield from zip(map(int, chunk[0::2]), map(int, chunk[1::2]), strict=True)
+
+
+def merge_ranges_external(
+    pairs: Iterable[tuple[int, int]],
+    run_size: int = 1_000_000,
+    chunk_rows: int = 65536,
+    tmp_dir: str | Path | None = None,
+) -> Iterator[tuple[int, int]]:
+    """
+    Merge (start, end) pairs like merge_ranges, with memory bounded by run_size.
+
+    External sort-merge: the input is cut into runs of run_size pairs, each
+    run is sorted and coalesced in NumPy and spilled to a temporary file of
+    int64 pairs, then all runs are k-way merged with heapq while coalescing
+    overlapping and adjacent intervals. Input that fits in one run never
+    touches disk. Temporary files are removed once the generator finishes.
+
+    Only one run is held while spilling. During the merge each run reads
+    min(chunk_rows, run_size // runs) pairs at a time (at least one), so the
+    read buffers of all runs together stay within about run_size pairs
+    however many runs the input produces.
+
+    Args:
+        pairs: Inclusive (start, end) ranges in any order (int64 values)
+        run_size: Maximum number of pairs held in memory while building a run
+        chunk_rows: Maximum pairs read back per run file at a time during the merge
+        tmp_dir: Directory for spilled runs (system default if None)
+
+    Yields:
+        Sorted, disjoint (start, end) tuples, identical to merge_ranges output
+
+    Raises:
+        ValueError: If any pair has start > end, or run_size or chunk_rows is below 1
+    """
+    if run_size < 1 or chunk_rows < 1:
+        raise ValueError(f"run_size and chunk_rows must be >= 1, got {run_size} and {chunk_rows}")
+    iterator = iter(pairs)
+    run = list(islice(iterator, run_size))
+    following = list(islice(iterator, 1))
+    if not following:
+        merged_run = _sorted_run(run)
+        del run
+        yield from map(tuple, merged_run.tolist())
+        return
+
+    iterator = chain(following, iterator)
+    with tempfile.TemporaryDirectory(dir=tmp_dir) as tmp:
+        run_paths: list[Path] = []
+        while run:
+            path = Path(tmp) / f"run-{len(run_paths)}.bin"
+            _sorted_run(run).tofile(path)
+            run_paths.append(path)
+            del run  # Free the spilled run before reading the next one
+            run = list(islice(iterator, run_size))
+        del run
+
+        buffer_rows = max(1, min(chunk_rows, run_size // len(run_paths)))
+        merged: tuple[int, int] | None = None
+        for start, end in heapq.merge(*(_read_run(path, buffer_rows) for path in run_paths)):
+            if merged is None:
+                merged = (start, end)
+            elif start <= merged[1] + 1:
+                merged = (merged[0], max(merged[1], end))
+            else:
+                yield merged
+                merged = (start, end)
+        if merged is not None:
+            yield merged
+
+
 def parse_database(data: str) -> tuple[list[FreshRange], list[int]]:
     """
     Parse the database string into a list of FreshRange objects and a list of ingredient IDs.
@@ -99,6 +260,67 @@ def is_fresh(ingredient_id: int, merged_ranges: list[tuple[int, int]]) -> bool:
     return False
 
 
+class IntervalIndex:
+    """
+    Sorted, disjoint inclusive intervals stored as contiguous int64 arrays.
+
+    Built from merge_ranges output. Membership of a whole batch of IDs is
+    answered with a single np.searchsorted call over the interval starts,
+    followed by one vectorized comparison against the matching ends.
+    """
+
+    def __init__(self, merged_ranges: list[tuple[int, int]]):
+        """
+        Args:
+            merged_ranges: Sorted, disjoint list of (start, end) tuples (see merge_ranges)
+
+        Raises:
+            OverflowError: If a bound does not fit in int64
+        """
+        self.starts = np.array([start for start, _ in merged_ranges], dtype=np.int64)
+        self.ends = np.array([end for _, end in merged_ranges], dtype=np.int64)
+
+    @classmethod
+    def from_ranges(cls, ranges: list[FreshRange]) -> "IntervalIndex":
+        """Merge raw FreshRange intervals and index the result."""
+        return cls(merge_ranges(ranges))
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def contains(self, ingredient_ids: Iterable[int] | np.ndarray) -> np.ndarray:
+        """
+        Check a batch of ingredient IDs for freshness.
+
+        Args:
+            ingredient_ids: IDs to check (any int64-representable values)
+
+        Returns:
+            Boolean array, True where the corresponding ID lies in some interval
+
+        Raises:
+            OverflowError: If an ID does not fit in int64
+        """
+        ids = np.asarray(ingredient_ids, dtype=np.int64)
+        if not len(self.starts):
+            return np.zeros(ids.shape, dtype=bool)
+        # Index of the last interval starting at or before each ID
+        pos = np.searchsorted(self.starts, ids, side="right") - 1
+        return (pos >= 0) & (ids <= self.ends[np.maximum(pos, 0)])
+
+    def count_fresh(self, ingredient_ids: Iterable[int] | np.ndarray) -> int:
+        """Count how many of the given ingredient IDs are fresh."""
+        return int(np.count_nonzero(self.contains(ingredient_ids)))
+
+    def total_covered(self) -> int:
+        """Count all IDs covered by the intervals."""
+        # Python ints: a single interval can cover more IDs than int64 holds
+        return sum(
+            end - start + 1
+            for start, end in zip(self.starts.tolist(), self.ends.tolist(), strict=True)
+        )
+
+
 def solve_part1(data: str) -> int:
     """
     Solve Day 5 Part 1: Count how many available ingredients are fresh.
@@ -107,7 +329,9 @@ def solve_part1(data: str) -> int:
     the count of fresh ingredients from the database.
 
     Time complexity: O(R log R + I log R) where R is the number of ranges
-    and I is the number of ingredient IDs.
+    and I is the number of ingredient IDs. The I lookups run as one
+    vectorized batch through IntervalIndex; bounds or IDs beyond int64 fall
+    back to is_fresh on Python ints.
 
     Args:
         data: The database string containing fresh ranges and ingredient IDs
@@ -118,16 +342,14 @@ def solve_part1(data: str) -> int:
     # Parse the database
     ranges, ingredient_ids = parse_database(data)
 
-    # Merge overlapping ranges
+    # Merge overlapping ranges and index them for batch lookups
     merged = merge_ranges(ranges)
 
     # Count fresh ingredients
-    count = 0
-    for ingredient_id in ingredient_ids:
-        if is_fresh(ingredient_id, merged):
-            count += 1
-
-    return count
+    try:
+        return IntervalIndex(merged).count_fresh(ingredient_ids)
+    except OverflowError:
+        return sum(is_fresh(ingredient_id, merged) for ingredient_id in ingredient_ids)
 
 
 def parse_ranges_part2(data: str) -> list[FreshRange]:
@@ -163,6 +385,38 @@ def parse_ranges_part2(data: str) -> list[FreshRange]:
     return ranges
 
 
+def parse_range_array(data: str) -> FreshRangeArray:
+    """
+    Parse the fresh ID ranges section into a compact FreshRangeArray.
+
+    All range bounds are converted to int64 in one bulk NumPy pass; only if
+    that fails are lines re-parsed one by one to report the malformed line.
+
+    Args:
+        data: The database string containing fresh ranges and available IDs
+
+    Returns:
+        A FreshRangeArray of all parsed ranges
+
+    Raises:
+        ValueError: If ranges section is malformed
+        OverflowError: If a range bound does not fit in int64
+    """
+    if not isinstance(data, str):
+        raise ValueError("Input data must be a string.")
+
+    header = data.strip().split("\n\n", 1)[0]
+    fields = [line.split("-") for line in header.splitlines() if line.strip()]
+    try:
+        bounds = np.array(fields, dtype=np.int64).reshape(len(fields), -1)
+    except (ValueError, OverflowError):
+        bounds = None
+    if bounds is None or bounds.shape[1:] != (2,):
+        # Slow path: locate the offending line for the error message
+        return FreshRangeArray.from_ranges(parse_ranges_part2(data))
+    return FreshRangeArray(bounds[:, 0], bounds[:, 1])
+
+
 def solve_part2(data: str) -> int:
     """
     Solve Day 5 Part 2: Count all unique ingredient IDs that are fresh.
@@ -178,8 +432,12 @@ def solve_part2(data: str) -> int:
     Returns:
         The count of all unique fresh ingredient IDs across all ranges
     """
-    # Parse only ranges (ignore available IDs)
-    ranges = parse_ranges_part2(data)
+    # Parse only ranges (ignore available IDs) into compact arrays, keeping
+    # Python ints when a bound does not fit in int64
+    try:
+        ranges = parse_range_array(data)
+    except OverflowError:
+        ranges = parse_ranges_part2(data)
 
     # Merge overlapping ranges into disjoint intervals
     merged = merge_ranges(ranges)
@@ -192,6 +450,195 @@ def solve_part2(data: str) -> int:
     return total_count
 
 
+class IntervalSet:
+    """
+    Mutable set of fresh IDs kept as sorted, disjoint, non-adjacent inclusive intervals.
+
+    Intervals live in two parallel sorted lists (starts and ends) located with
+    bisect, so ranges can arrive and leave continuously without re-merging the
+    whole collection. The covered ID count is maintained on every update, so
+    the Part 2 answer is always available via total_covered().
+
+    Each operation does O(log n) bisect work plus a list slice assignment
+    proportional to the intervals it merges or splits.
+    """
+
+    def __init__(self, ranges: Iterable[FreshRange] = ()):
+        self._starts: list[int] = []
+        self._ends: list[int] = []
+        self._covered = 0
+        for r in ranges:
+            self.add(r.start, r.end)
+
+    def add(self, start: int, end: int) -> None:
+        """
+        Mark IDs start..end (inclusive) fresh, merging overlapping or adjacent intervals.
+
+        Raises:
+            ValueError: If start > end
+        """
+        if start > end:
+            raise ValueError(f"Invalid range: start ({start}) > end ({end})")
+        starts, ends = self._starts, self._ends
+        # Intervals [lo, hi) overlap or touch start..end
+        lo = bisect_left(ends, start - 1)
+        hi = bisect_right(starts, end + 1)
+        if lo < hi:
+            start = min(start, starts[lo])
+            end = max(end, ends[hi - 1])
+            self._covered -= sum(ends[i] - starts[i] + 1 for i in range(lo, hi))
+        starts[lo:hi] = [start]
+        ends[lo:hi] = [end]
+        self._covered += end - start + 1
+
+    def remove(self, start: int, end: int) -> None:
+        """
+        Mark IDs start..end (inclusive) spoiled, splitting intervals that straddle it.
+
+        Raises:
+            ValueError: If start > end
+        """
+        if start > end:
+            raise ValueError(f"Invalid range: start ({start}) > end ({end})")
+        starts, ends = self._starts, self._ends
+        # Intervals [lo, hi) share at least one ID with start..end
+        lo = bisect_left(ends, start)
+        hi = bisect_right(starts, end)
+        if lo >= hi:
+            return
+        self._covered -= sum(ends[i] - starts[i] + 1 for i in range(lo, hi))
+        kept_starts, kept_ends = [], []
+        if starts[lo] < start:
+            kept_starts.append(starts[lo])
+            kept_ends.append(start - 1)
+        if ends[hi - 1] > end:
+            kept_starts.append(end + 1)
+            kept_ends.append(ends[hi - 1])
+        starts[lo:hi] = kept_starts
+        ends[lo:hi] = kept_ends
+        self._covered += sum(e - s + 1 for s, e in zip(kept_starts, kept_ends, strict=True))
+
+    def contains(self, ingredient_id: int) -> bool:
+        """Check if an ingredient ID is fresh."""
+        i = bisect_right(self._starts, ingredient_id) - 1
+        return i >= 0 and ingredient_id <= self._ends[i]
+
+    def __contains__(self, ingredient_id: int) -> bool:
+        return self.contains(ingredient_id)
+
+    def total_covered(self) -> int:
+        """Count all fresh IDs (the Part 2 answer) in O(1)."""
+        return self._covered
+
+    def __len__(self) -> int:
+        return len(self._starts)
+
+    def __iter__(self) -> Iterator[tuple[int, int]]:
+        return zip(self._starts, self._ends, strict=True)
+
+
+def read_ranges_stream(fp: TextIO) -> IntervalSet:
+    """
+    Consume the fresh ranges section of a database stream into an IntervalSet.
+
+    Reads line by line up to (and including) the blank separator line, so the
+    stream is left positioned at the first ingredient ID. Memory is
+    proportional to the number of merged ranges, not the number of lines.
+
+    Args:
+        fp: Text stream positioned at the start of the database
+
+    Returns:
+        IntervalSet holding the merged fresh ranges
+
+    Raises:
+        ValueError: If a range line is malformed
+    """
+    ranges = IntervalSet()
+    seen_range = False
+    for line in fp:
+        if not line.strip():
+            if seen_range:
+                break
+            continue
+        try:
+            start, end = map(int, line.strip().split("-"))
+            ranges.add(start, end)
+        except ValueError as e:
+            raise ValueError(f"Malformed range line: '{line.rstrip()}'") from e
+        seen_range = True
+    return ranges
+
+
+def _id_batch(batch: list[int]) -> np.ndarray | list[int]:
+    """Pack IDs into an int64 array, keeping Python ints if one does not fit."""
+    try:
+        return np.array(batch, dtype=np.int64)
+    except OverflowError:
+        return batch
+
+
+def iter_id_batches(fp: TextIO, batch_size: int = 65536) -> Iterator[np.ndarray | list[int]]:
+    """
+    Stream ingredient IDs from the remaining lines of fp as int64 batches.
+
+    Args:
+        fp: Text stream positioned after the ranges section (see read_ranges_stream)
+        batch_size: Maximum number of IDs per yielded batch
+
+    Yields:
+        int64 arrays of at most batch_size ingredient IDs; a batch holding an
+        ID beyond int64 is yielded as a list of Python ints instead
+
+    Raises:
+        ValueError: If an ingredient ID line is malformed
+    """
+    batch: list[int] = []
+    for line in fp:
+        if not line.strip():
+            continue
+        try:
+            batch.append(int(line.strip()))
+        except ValueError as e:
+            raise ValueError(f"Malformed ingredient ID line: '{line.rstrip()}'") from e
+        if len(batch) == batch_size:
+            yield _id_batch(batch)
+            batch = []
+    if batch:
+        yield _id_batch(batch)
+
+
+def solve_stream(fp: TextIO, batch_size: int = 65536) -> tuple[int, int]:
+    """
+    Solve both parts from a database stream without loading it into memory.
+
+    The ranges section is merged incrementally into an IntervalSet, which is
+    then frozen into an IntervalIndex; ingredient IDs are checked batch by
+    batch. Memory is O(merged ranges + batch_size). Bounds or IDs beyond
+    int64 are checked with IntervalSet.contains on Python ints instead.
+
+    Args:
+        fp: Text stream containing the full database
+        batch_size: Number of ingredient IDs checked per vectorized batch
+
+    Returns:
+        Tuple of (Part 1 fresh ingredient count, Part 2 total fresh ID count)
+    """
+    ranges = read_ranges_stream(fp)
+    try:
+        index = IntervalIndex(list(ranges))
+    except OverflowError:
+        index = None  # Bounds beyond int64: every batch is checked on Python ints
+    fresh_count = 0
+    for batch in iter_id_batches(fp, batch_size):
+        if index is not None and isinstance(batch, np.ndarray):
+            fresh_count += index.count_fresh(batch)
+        else:
+            ids = batch.tolist() if isinstance(batch, np.ndarray) else batch
+            fresh_count += sum(map(ranges.contains, ids))
+    return fresh_count, ranges.total_covered()
+
+
 if __name__ == "__main__":
     import argparse
     from pathlib import Path
@@ -199,20 +646,27 @@ if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Advent of Code 2025 - Day 5")
     parser.add_argument("--part", type=int, choices=[1, 2], default=1, help="Which part to solve")
     parser.add_argument("--test", action="store_true", help="Use test input instead of real input")
+    parser.add_argument("--stream", action="store_true", help="Stream the input file (both parts)")
     args = parser.parse_args()
 
     # Determine input file
     day_dir = Path(__file__).parent
     input_file = day_dir / ("test_input.txt" if args.test else "input.txt")
 
-    # Load input
-    with open(input_file) as f:
-        data = f.read()
-
-    # Solve
-    if args.part == 1:
-        result = solve_part1(data)
-        print(f"Part 1: {result}")
+    if args.stream:
+        with open(input_file) as f:
+            part1, part2 = solve_stream(f)
+        print(f"Part 1: {part1}")
+        print(f"Part 2: {part2}")
     else:
-        result = solve_part2(data)
-        print(f"Part 2: {result}")
+        # Load input
+        with open(input_file) as f:
+            data = f.read()
+
+        # Solve
+        if args.part == 1:
+            result = solve_part1(data)
+            print(f"Part 1: {result}")
+        else:
+            result = solve_part2(data)
+            print(f"Part 2: {result}")
@@ -315,3 +315,322 @@ def test_edge_case_many_overlapping_ranges():
     data = ranges_str + "\n\n"
     result = solve_part2(data)
     assert result == 5, f"Expected 5 fresh IDs (no double-count), got {result}"
+
+
+# =============================================================================
+# INTERVAL INDEX (batch freshness queries)
+# =============================================================================
+
+
+def test_interval_index_batch_matches_is_fresh():
+    """IntervalIndex answers a batch of IDs exactly like is_fresh"""
+    from .solution import IntervalIndex, is_fresh
+
+    ranges = [FreshRange(3, 5), FreshRange(10, 14), FreshRange(16, 20), FreshRange(12, 18)]
+    merged = merge_ranges(ranges)
+    index = IntervalIndex(merged)
+    ids = list(range(-2, 25))
+    assert index.contains(ids).tolist() == [is_fresh(i, merged) for i in ids]
+    assert index.count_fresh([1, 5, 8, 11, 17, 32]) == 3
+    assert index.total_covered() == 14
+    assert len(index) == 2
+
+
+def test_interval_index_empty():
+    """Empty index and empty ID batches"""
+    from .solution import IntervalIndex
+
+    assert IntervalIndex([]).count_fresh([1, 2, 3]) == 0
+    assert IntervalIndex([(1, 5)]).count_fresh([]) == 0
+    assert IntervalIndex.from_ranges([]).total_covered() == 0
+
+
+def test_interval_index_large_ids():
+    """IDs beyond 32-bit range are handled in int64"""
+    from .solution import IntervalIndex
+
+    index = IntervalIndex.from_ranges([FreshRange(70642195371793, 72879218404633)])
+    assert index.contains([70642195371792, 70642195371793, 72879218404633]).tolist() == [
+        False,
+        True,
+        True,
+    ]
+
+
+def test_solve_part1_beyond_int64():
+    """IDs and bounds that overflow int64 fall back to is_fresh"""
+    import pytest
+
+    from .solution import IntervalIndex, solve_part1
+
+    with pytest.raises(OverflowError):
+        IntervalIndex([(1, 3)]).contains([2**63])
+    assert solve_part1("1-3\n\n99999999999999999999\n2") == 1
+    assert solve_part1("1-99999999999999999999\n\n5\n2\n100000000000000000000") == 2
+
+
+# =============================================================================
+# INTERVAL SET (incremental inserts and deletes)
+# =============================================================================
+
+
+def test_interval_set_matches_merge_ranges():
+    """Incremental adds give the same intervals and count as merge_ranges"""
+    from .solution import IntervalSet
+
+    ranges = [FreshRange(3, 5), FreshRange(10, 14), FreshRange(16, 20), FreshRange(12, 18)]
+    interval_set = IntervalSet(ranges)
+    assert list(interval_set) == merge_ranges(ranges) == [(3, 5), (10, 20)]
+    assert interval_set.total_covered() == 14
+    assert 17 in interval_set and 8 not in interval_set
+
+
+def test_interval_set_remove_splits_and_trims():
+    """Removing a middle range splits an interval; removing edges trims it"""
+    from .solution import IntervalSet
+
+    interval_set = IntervalSet()
+    interval_set.add(1, 10)
+    interval_set.add(11, 20)  # adjacent -> merged
+    assert list(interval_set) == [(1, 20)]
+    interval_set.remove(5, 7)
+    assert list(interval_set) == [(1, 4), (8, 20)]
+    interval_set.remove(0, 1)
+    interval_set.remove(19, 30)
+    assert list(interval_set) == [(2, 4), (8, 18)]
+    assert interval_set.total_covered() == 14
+    interval_set.remove(100, 200)  # no-op
+    interval_set.remove(0, 100)
+    assert len(interval_set) == 0 and interval_set.total_covered() == 0
+
+
+def test_interval_set_random_against_brute_force():
+    """Random add/remove sequences agree with a plain Python set of IDs"""
+    import random
+
+    from .solution import IntervalSet
+
+    rng = random.Random(5)
+    interval_set, ids = IntervalSet(), set()
+    for _ in range(500):
+        start = rng.randint(0, 60)
+        end = start + rng.randint(0, 8)
+        if rng.random() < 0.6:
+            interval_set.add(start, end)
+            ids.update(range(start, end + 1))
+        else:
+            interval_set.remove(start, end)
+            ids.difference_update(range(start, end + 1))
+        assert interval_set.total_covered() == len(ids)
+    assert [i for i in range(-1, 72) if i in interval_set] == sorted(ids)
+    assert list(interval_set) == merge_ranges([FreshRange(i, i) for i in ids])
+
+
+def test_interval_set_invalid_range():
+    """start > end is rejected"""
+    import pytest
+
+    from .solution import IntervalSet
+
+    with pytest.raises(ValueError):
+        IntervalSet().add(5, 3)
+    with pytest.raises(ValueError):
+        IntervalSet().remove(5, 3)
+
+
+# =============================================================================
+# STREAMING DATABASE READER
+# =============================================================================
+
+
+def test_solve_stream_example():
+    """Streaming both parts matches solve_part1 and solve_part2"""
+    import io
+
+    from .solution import solve_part1, solve_part2, solve_stream
+
+    data = "3-5\n10-14\n16-20\n12-18\n\n1\n5\n8\n11\n17\n32\n"
+    assert solve_stream(io.StringIO(data)) == (solve_part1(data), solve_part2(data)) == (3, 14)
+    assert solve_stream(io.StringIO(data), batch_size=2) == (3, 14)
+
+
+def test_solve_stream_sections():
+    """Ranges-only input, leading blank lines and batch boundaries"""
+    import io
+
+    from .solution import iter_id_batches, read_ranges_stream, solve_stream
+
+    assert solve_stream(io.StringIO("1-3\n5-7\n")) == (0, 6)
+    fp = io.StringIO("\n\n1-10\n\n1\n2\n\n3\n")
+    assert list(read_ranges_stream(fp)) == [(1, 10)]
+    assert [batch.tolist() for batch in iter_id_batches(fp, batch_size=2)] == [[1, 2], [3]]
+
+
+def test_solve_stream_beyond_int64():
+    """IDs and bounds that overflow int64 are checked on Python ints"""
+    import io
+
+    from .solution import iter_id_batches, solve_part1, solve_stream
+
+    data = "1-3\n\n2\n" + str(2**70)
+    assert solve_stream(io.StringIO(data)) == (solve_part1(data), 3)
+    assert solve_stream(io.StringIO(data), batch_size=1) == (1, 3)
+    assert solve_stream(io.StringIO(f"1-{2**70}\n\n5\n{2**71}\n")) == (1, 2**70)
+    batches = list(iter_id_batches(io.StringIO(f"4\n{2**64}\n"), batch_size=1))
+    assert [batch.tolist() for batch in batches[:1]] == [[4]] and batches[1] == [2**64]
+
+
+def test_solve_stream_malformed():
+    """Malformed lines raise ValueError like parse_database"""
+    import io
+
+    import pytest
+
+    from .solution import solve_stream
+
+    with pytest.raises(ValueError, match="Malformed range line"):
+        solve_stream(io.StringIO("1-x\n\n5\n"))
+    with pytest.raises(ValueError, match="Malformed ingredient ID line"):
+        solve_stream(io.StringIO("1-3\n\nfive\n"))
+
+
+# =============================================================================
+# EXTERNAL SORT-MERGE
+# =============================================================================
+
+
+def test_merge_ranges_external_matches_merge_ranges(tmp_path):
+    """Spilled runs k-way merged give exactly merge_ranges output"""
+    import random
+
+    from .solution import merge_ranges_external
+
+    rng = random.Random(34)
+    pairs = []
+    for _ in range(2000):
+        start = rng.randint(0, 50_000)
+        pairs.append((start, start + rng.randint(0, 40)))
+    expected = merge_ranges([FreshRange(s, e) for s, e in pairs])
+    result = list(merge_ranges_external(pairs, run_size=150, chunk_rows=16, tmp_dir=tmp_path))
+    assert result == expected
+    assert list(tmp_path.iterdir()) == []  # spilled runs cleaned up
+
+
+def test_merge_ranges_external_in_memory_and_empty():
+    """Input within one run is merged without spilling; empty input yields nothing"""
+    from .solution import merge_ranges_external
+
+    pairs = [(3, 5), (10, 14), (16, 20), (12, 18)]
+    assert list(merge_ranges_external(pairs)) == [(3, 5), (10, 20)]
+    assert list(merge_ranges_external([(1, 10), (11, 20)], run_size=1)) == [(1, 20)]
+    assert list(merge_ranges_external([])) == []
+
+
+def test_merge_ranges_external_memory_is_flat():
+    """Peak memory depends on run_size, not on how many runs the input produces"""
+    import random
+    import tracemalloc
+
+    from .solution import merge_ranges_external
+
+    def pairs(count):
+        rng = random.Random(34)
+        for _ in range(count):
+            start = rng.randrange(10**12)
+            yield start, start + rng.randrange(100)
+
+    peaks = []
+    for count in (20_000, 80_000):
+        tracemalloc.start()
+        merged = sum(1 for _ in merge_ranges_external(pairs(count), run_size=1000))
+        peaks.append(tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+        assert merged > count * 0.99
+    assert peaks[1] < peaks[0] * 1.25
+
+
+def test_merge_ranges_external_invalid():
+    """start > end and non-positive run or chunk sizes are rejected"""
+    import pytest
+
+    from .solution import merge_ranges_external
+
+    with pytest.raises(ValueError):
+        list(merge_ranges_external([(1, 2), (5, 3)]))
+    with pytest.raises(ValueError):
+        list(merge_ranges_external([(1, 2)], run_size=0))
+    with pytest.raises(ValueError):
+        list(merge_ranges_external([(1, 2), (4, 5)], run_size=1, chunk_rows=0))
+
+
+# =============================================================================
+# COMPACT FRESH RANGES
+# =============================================================================
+
+
+def test_fresh_range_has_slots():
+    """FreshRange carries no per-instance __dict__"""
+    assert not hasattr(FreshRange(1, 2), "__dict__")
+
+
+def test_fresh_range_array_round_trip():
+    """FreshRangeArray packs ranges and merges like a list of FreshRange"""
+    from .solution import FreshRangeArray
+
+    ranges = [FreshRange(3, 5), FreshRange(10, 14), FreshRange(16, 20), FreshRange(12, 18)]
+    array = FreshRangeArray.from_ranges(ranges)
+    assert len(array) == 4
+    assert array[3] == FreshRange(12, 18)
+    assert list(array) == ranges
+    assert merge_ranges(array) == merge_ranges(ranges) == [(3, 5), (10, 20)]
+    assert merge_ranges(FreshRangeArray([], [])) == []
+
+
+def test_fresh_range_array_bulk_validation():
+    """Invalid ranges are rejected in one pass, reporting the first offender"""
+    import pytest
+
+    from .solution import FreshRangeArray
+
+    with pytest.raises(ValueError, match=r"start \(9\) > end \(4\)"):
+        FreshRangeArray([1, 9, 8], [2, 4, 7])
+    with pytest.raises(ValueError):
+        FreshRangeArray([1, 2], [3])
+
+
+def test_parse_range_array():
+    """Bulk range parsing matches parse_ranges_part2 and reports malformed lines"""
+    import pytest
+
+    from .solution import parse_range_array, parse_ranges_part2
+
+    data = "3-5\n10-14\n16-20\n12-18\n\n1\n5\n"
+    assert list(parse_range_array(data)) == parse_ranges_part2(data)
+    assert len(parse_range_array("\n\n")) == 0
+    with pytest.raises(ValueError, match="Malformed range line: '1-2-3'"):
+        parse_range_array("1-2-3\n4-5-6\n")
+    with pytest.raises(ValueError, match="Malformed range line: '7'"):
+        parse_range_array("3-5\n7\n")
+
+
+def test_solve_part2_beyond_int64():
+    """Range bounds that overflow int64 fall back to Python int ranges"""
+    import pytest
+
+    from .solution import parse_range_array, solve_part2
+
+    with pytest.raises(OverflowError):
+        parse_range_array("99999999999999999999-99999999999999999999\n")
+    assert solve_part2("99999999999999999999-99999999999999999999\n\n1") == 1
+    assert solve_part2("1-3\n2-100000000000000000000\n") == 100000000000000000000
+
+
+def test_solve_part2_int64_max():
+    """Ranges ending at int64 max merge without wrapping around"""
+    from .solution import FreshRangeArray, IntervalIndex, solve_part2
+
+    int64_max = 2**63 - 1
+    assert solve_part2(f"0-{int64_max}\n5-7") == 2**63
+    assert solve_part2(f"3-{int64_max}\n{int64_max}-{int64_max}\n1-1") == 2**63 - 2
+    assert merge_ranges(FreshRangeArray([0, 5], [int64_max, 7])) == [(0, int64_max)]
+    assert IntervalIndex([(0, int64_max)]).total_covered() == 2**63
@@ -11,7 +11,10 @@ vertically-formatted math worksheets where:
 The pipeline processes worksheets without loading them entirely into memory:
 1. read_lines_as_stream: Read input line-by-line
 2. columns_from_lines: Convert lines to vertical columns
-3. problem_column_groups: Group columns by separator boundaries
+   (columns_from_file reads a worksheet file in column bands instead, so only
+   rows x band_width characters are held at once)
+3. problem_column_groups: Group columns by separator boundaries, yielding each
+   group as soon as its closing separator column is seen
 4. extract_problem: Parse each group into a Problem
 
 Example:
@@ -135,7 +138,79 @@ def columns_from_lines(lines: Iterator[str]) -> Iterator[Column]:
         yield Column(index=col_idx, values=values)
 
 
-def extract_problem(problem_group: ProblemGroup) -> "Problem":
+def _line_spans(f: IO[bytes], chunk_size: int = 1 << 20) -> List[tuple[int, int]]:
+    """
+    Scan a binary file in chunks and return (offset, length) of every line.
+
+    Lengths exclude the line terminator (\n or \r\n). Only the spans are kept,
+    so memory is proportional to the number of rows, not the line width.
+    """
+    spans: List[tuple[int, int]] = []
+    line_start = 0
+    pos = 0
+    prev_byte = b""
+    while chunk := f.read(chunk_size):
+        newline = chunk.find(b"\n")
+        while newline >= 0:
+            end = pos + newline
+            before = chunk[newline - 1 : newline] if newline else prev_byte
+            length = end - line_start - (1 if before == b"\r" else 0)
+            spans.append((line_start, max(length, 0)))
+            line_start = end + 1
+            newline = chunk.find(b"\n", newline + 1)
+        pos += len(chunk)
+        prev_byte = chunk[-1:]
+    if line_start < pos:
+        length = pos - line_start - (1 if prev_byte == b"\r" else 0)
+        spans.append((line_start, length))
+    return spans
+
+
+def columns_from_file(path: Union[str, Path], band_width: int = 4096) -> Iterator[Column]:
+    """
+    Yield the columns of a worksheet file by reading it in column bands.
+
+    The file is scanned once to record each line's byte offset and length.
+    Columns are then produced band by band: for each row, only the bytes of
+    the current band are read (seek to line offset + band start), so at most
+    rows x band_width characters are in memory. Worksheets are ASCII, so byte
+    offsets equal character positions. Output matches columns_from_lines.
+
+    Args:
+        path: Worksheet file path
+        band_width: Number of columns read per band
+
+    Yields:
+        Column: Column objects, left to right
+    """
+    with open(path, "rb") as f:
+        spans = _line_spans(f)
+        width = max((length for _, length in spans), default=0)
+        for band_start in range(0, width, band_width):
+            band = min(band_width, width - band_start)
+            rows = []
+            for offset, length in spans:
+                count = min(band, length - band_start)
+                if count > 0:
+                    f.seek(offset + band_start)
+                    rows.append(f.read(count).decode("ascii").ljust(band))
+                else:
+                    rows.append(" " * band)
+            for col in range(band):
+                yield Column(index=band_start + col, values=[row[col] for row in rows])
+
+
+def columns_from_source(source: Union[str, Path, IO], band_width: int = 4096) -> Iterator[Column]:
+    """
+    Yield worksheet columns from a path (band-wise, see columns_from_file) or a
+    file-like object (via read_lines_as_stream and columns_from_lines).
+    """
+    if isinstance(source, (str, Path)):
+        return columns_from_file(source, band_width)
+    return columns_from_lines(read_lines_as_stream(source))
+
+
+def extract_problem(problem_group: ProblemGroup, evaluate: bool = True) -> "Problem":
     """
     Extract a single problem from a group of columns.
 
@@ -144,6 +219,8 @@ def extract_problem(problem_group: ProblemGroup) -> "Problem":
 
     Args:
         problem_group: A ProblemGroup containing columns of a single problem
+        evaluate: Compute the result now; if False, result is left as 0 so the
+            caller can evaluate later (e.g. in a process pool)
 
     Returns:
         Problem: The parsed problem with operands, operation, and result
@@ -151,7 +228,7 @@ def extract_problem(problem_group: ProblemGroup) -> "Problem":
     Raises:
         ValueError: If problem format is invalid (no operation found, etc.)
     """
-    from utils import Problem
+    from utils import Problem, evaluate_problem
 
     if not problem_group.columns:
         raise ValueError("Problem group has no columns")
@@ -190,15 +267,10 @@ def extract_problem(problem_group: ProblemGroup) -> "Problem":
     if not operands:
         raise ValueError("No operands found in problem")
 
-    # Evaluate the problem
-    if operation_char == "+":
-        result = sum(operands)
-    else:  # "*"
-        result = 1
-        for op in operands:
-            result *= op
-
-    return Problem(operands=operands, operation=operation_char, result=result)
+    problem = Problem(operands=operands, operation=operation_char, result=0)
+    if evaluate:
+        problem.result = evaluate_problem(problem)
+    return problem
 
 
 def problem_column_groups(columns: Iterator[Column]) -> Iterator[ProblemGroup]:
@@ -212,32 +284,26 @@ def problem_column_groups(columns: Iterator[Column]) -> Iterator[ProblemGroup]:
         columns: Iterator of Column objects from the worksheet
 
     Yields:
-        ProblemGroup: Groups of contiguous non-separator columns
+        ProblemGroup: Groups of contiguous non-separator columns, each yielded as
+        soon as the separator column (or end of input) that closes it is seen
     """
-    all_columns = list(columns)
+    group_columns: List[Column] = []
 
-    if not all_columns:
-        return
-
-    start_idx = None
-
-    for idx, col in enumerate(all_columns):
+    for idx, col in enumerate(columns):
         if col.is_separator:
             # End of a problem group
-            if start_idx is not None:
+            if group_columns:
                 yield ProblemGroup(
-                    start_column=start_idx, end_column=idx - 1, columns=all_columns[start_idx:idx]
+                    start_column=idx - len(group_columns), end_column=idx - 1, columns=group_columns
                 )
-                start_idx = None
+                group_columns = []
         else:
-            # Start of a problem group
-            if start_idx is None:
-                start_idx = idx
+            group_columns.append(col)
 
     # Don't forget the last group if it ends at the last column
-    if start_idx is not None:
+    if group_columns:
         yield ProblemGroup(
-            start_column=start_idx, end_column=len(all_columns) - 1, columns=all_columns[start_idx:]
+            start_column=idx - len(group_columns) + 1, end_column=idx, columns=group_columns
         )
 
 
@@ -254,43 +320,8 @@ def problem_column_groups_part2(columns: Iterator[Column]) -> Iterator[ProblemGr
     Yields:
         ProblemGroup: Groups of contiguous non-separator columns (yielded right-to-left)
     """
-    all_columns = list(columns)
-
-    if not all_columns:
-        return
-
-    # Find all groups (left-to-right)
-    groups = []
-    start_idx = None
-
-    for idx, col in enumerate(all_columns):
-        if col.is_separator:
-            # End of a problem group
-            if start_idx is not None:
-                group_cols = all_columns[start_idx:idx]
-                groups.append(
-                    ProblemGroup(
-                        start_column=start_idx,
-                        end_column=idx - 1,
-                        columns=group_cols,
-                    )
-                )
-                start_idx = None
-        else:
-            # Start of a problem group
-            if start_idx is None:
-                start_idx = idx
-
-    # Don't forget the last group if it ends at the last column
-    if start_idx is not None:
-        group_cols = all_columns[start_idx:]
-        groups.append(
-            ProblemGroup(
-                start_column=start_idx,
-                end_column=len(all_columns) - 1,
-                columns=group_cols,
-            )
-        )
+    # Find all groups (left-to-right); right-to-left order needs them all
+    groups = list(problem_column_groups(columns))
 
     # Yield groups in right-to-left order
     for group in reversed(groups):
@@ -303,7 +334,7 @@ def problem_column_groups_part2(columns: Iterator[Column]) -> Iterator[ProblemGr
         )
 
 
-def extract_problem_part2(problem_group: ProblemGroup) -> "Problem":
+def extract_problem_part2(problem_group: ProblemGroup, evaluate: bool = True) -> "Problem":
     """
     Extract a single problem from a group of columns (Part 2 version: right-to-left).
 
@@ -314,6 +345,8 @@ def extract_problem_part2(problem_group: ProblemGroup) -> "Problem":
 
     Args:
         problem_group: A ProblemGroup containing columns of a single problem
+        evaluate: Compute the result now; if False, result is left as 0 so the
+            caller can evaluate later (e.g. in a process pool)
 
     Returns:
         Problem: The parsed problem with operands, operation, and result
@@ -321,7 +354,7 @@ def extract_problem_part2(problem_group: ProblemGroup) -> "Problem":
     Raises:
         ValueError: If problem format is invalid
     """
-    from utils import Problem
+    from utils import Problem, evaluate_problem
 
     if not problem_group.columns:
         raise ValueError("Problem group has no columns")
@@ -361,12 +394,7 @@ def extract_problem_part2(problem_group: ProblemGroup) -> "Problem":
     if not operands:
         raise ValueError("No operands found in problem")
 
-    # Evaluate the problem
-    if operation_char == "+":
-        result = sum(operands)
-    else:  # "*"
-        result = 1
-        for op in operands:
-            result *= op
-
-    return Problem(operands=operands, operation=operation_char, result=result)
+    problem = Problem(operands=operands, operation=operation_char, result=0)
+    if evaluate:
+        problem.result = evaluate_problem(problem)
+    return problem
@@ -29,24 +29,31 @@ Example:
 from typing import Union, Any
 from pathlib import Path
 
-# Import shared components
-from .utils import Problem, evaluate_problem
+# Import shared components (evaluate_problem is re-exported for callers of this module)
+from .utils import Problem, evaluate_problems
+from .utils import evaluate_problem as evaluate_problem
 
 
 def solve_worksheet(
-    source: Union[str, Path, Any], verbose: bool = False, debug: bool = False
+    source: Union[str, Path, Any],
+    verbose: bool = False,
+    debug: bool = False,
+    workers: int = 1,
+    batch_size: int = 256,
 ) -> int:
     """
     Solve a complete worksheet and return the grand total of all problem results.
 
     This function implements the full streaming pipeline:
-    read_lines_as_stream → columns_from_lines → problem_column_groups →
+    columns_from_source → problem_column_groups →
     extract_problem → evaluate_problem → sum results
 
     Args:
         source: File path (str or Path) or file-like object (IO)
         verbose: Print problem details and results
         debug: Print detailed debug information
+        workers: Worker processes for evaluating problems; 1 evaluates serially
+        batch_size: Problems sent to a worker per task when workers > 1
 
     Returns:
         int: Grand total (sum of all problem results)
@@ -58,8 +65,7 @@ def solve_worksheet(
     """
     # Import here to avoid circular imports
     from parser import (
-        read_lines_as_stream,
-        columns_from_lines,
+        columns_from_source,
         problem_column_groups,
         extract_problem,
     )
@@ -69,19 +75,18 @@ def solve_worksheet(
     problem_count = 0
 
     try:
-        # Stream the lines from the source
-        lines = read_lines_as_stream(source)
-
-        # Transform lines to columns
-        cols = columns_from_lines(lines)
+        # Stream the columns from the source (file paths are read in column bands)
+        cols = columns_from_source(source)
 
         # Group columns into problems
         groups = problem_column_groups(cols)
 
-        # Process each problem
-        for group in groups:
-            problem = extract_problem(group)
-            result = evaluate_problem(problem)
+        # Extract problems lazily; their (possibly costly) results are computed below
+        problems = (extract_problem(group, evaluate=False) for group in groups)
+
+        # Evaluate each problem (across a process pool when workers > 1, in order)
+        for problem, result in evaluate_problems(problems, workers, batch_size):
+            problem.result = result
             grand_total += result
             problem_count += 1
 
@@ -4,6 +4,7 @@ Implements problem evaluation and worksheet solving logic for right-to-left colu
 
 This module provides:
 - solve_worksheet: Main entry point to solve an entire worksheet (Part 2 specific)
+- solve_both_parts: Single pass returning the Part 1 and Part 2 grand totals
 
 The solve_worksheet function reuses the data model (Problem) and evaluation logic
 (evaluate_problem) from utils.py, with only the parsing/grouping logic specific to Part 2.
@@ -38,23 +39,29 @@ from typing import Union, Any
 from pathlib import Path
 
 # Import shared components
-from .utils import Problem, evaluate_problem
+from .utils import Problem, evaluate_problems
 
 
 def solve_worksheet(
-    source: Union[str, Path, Any], verbose: bool = False, debug: bool = False
+    source: Union[str, Path, Any],
+    verbose: bool = False,
+    debug: bool = False,
+    workers: int = 1,
+    batch_size: int = 256,
 ) -> int:
     """
     Solve a complete worksheet (Part 2 - right-to-left columns) and return the grand total.
 
     This function implements the full streaming pipeline for Part 2:
-    read_lines_as_stream → columns_from_lines → problem_column_groups_part2 →
+    columns_from_source → problem_column_groups_part2 →
     extract_problem_part2 → evaluate_problem → sum results
 
     Args:
         source: File path (str or Path) or file-like object (IO)
         verbose: Print problem details and results
         debug: Print detailed debug information
+        workers: Worker processes for evaluating problems; 1 evaluates serially
+        batch_size: Problems sent to a worker per task when workers > 1
 
     Returns:
         int: Grand total (sum of all problem results)
@@ -66,8 +73,7 @@ def solve_worksheet(
     """
     # Import here to avoid circular imports
     from parser import (
-        read_lines_as_stream,
-        columns_from_lines,
+        columns_from_source,
         problem_column_groups_part2,
         extract_problem_part2,
     )
@@ -77,19 +83,18 @@ def solve_worksheet(
     problem_count = 0
 
     try:
-        # Stream the lines from the source
-        lines = read_lines_as_stream(source)
-
-        # Transform lines to columns
-        cols = columns_from_lines(lines)
+        # Stream the columns from the source (file paths are read in column bands)
+        cols = columns_from_source(source)
 
         # Group columns into problems (Part 2 version: right-to-left)
         groups = problem_column_groups_part2(cols)
 
-        # Process each problem
-        for group in groups:
-            problem = extract_problem_part2(group)
-            result = evaluate_problem(problem)
+        # Extract problems lazily; their (possibly costly) results are computed below
+        problems = (extract_problem_part2(group, evaluate=False) for group in groups)
+
+        # Evaluate each problem (across a process pool when workers > 1, in order)
+        for problem, result in evaluate_problems(problems, workers, batch_size):
+            problem.result = result
             grand_total += result
             problem_count += 1
 
@@ -115,6 +120,53 @@ def solve_worksheet(
         raise
 
 
+def solve_both_parts(
+    source: Union[str, Path, Any], workers: int = 1, batch_size: int = 256
+) -> tuple[int, int]:
+    """
+    Solve Part 1 and Part 2 in one pass over the worksheet.
+
+    Columns are read and grouped once (left to right). Each group yields both
+    its row-wise Part 1 problem (extract_problem) and its column-wise Part 2
+    problem (extract_problem_part2 on the same columns, reversed). The order
+    in which Part 2 problems are summed does not change its grand total.
+
+    Args:
+        source: File path (str or Path) or file-like object (IO)
+        workers: Worker processes for evaluating problems; 1 evaluates serially
+        batch_size: Problems sent to a worker per task when workers > 1
+
+    Returns:
+        tuple[int, int]: (Part 1 grand total, Part 2 grand total)
+
+    Raises:
+        ValueError: If problem parsing fails
+    """
+    from parser import (
+        ProblemGroup,
+        columns_from_source,
+        extract_problem,
+        extract_problem_part2,
+        problem_column_groups,
+    )
+
+    def both_problems():
+        for group in problem_column_groups(columns_from_source(source)):
+            yield extract_problem(group, evaluate=False)
+            right_to_left = ProblemGroup(
+                start_column=group.start_column,
+                end_column=group.end_column,
+                columns=group.columns[::-1],
+            )
+            yield extract_problem_part2(right_to_left, evaluate=False)
+
+    totals = [0, 0]
+    problems = evaluate_problems(both_problems(), workers, batch_size)
+    for index, (_, result) in enumerate(problems):
+        totals[index % 2] += result
+    return totals[0], totals[1]
+
+
 def main():
     """Main entry point for running the solution."""
     import os
@@ -122,3 +122,39 @@ def test_extract_problem_no_operands():
     problem_group = parser.ProblemGroup(start_column=0, end_column=1, columns=cols)
     with pytest.raises(ValueError, match="No operands found"):
         parser.extract_problem(problem_group)
+
+
+def test_columns_from_file_matches_columns_from_lines(tmp_path):
+    """Band-wise file columns equal in-memory columns (ragged rows, CRLF, small bands)."""
+    text = "123 328  51 64\r\n 45 64  387 23\r\n  6 98  215 314\r\n*   +   *   +\r\n"
+    file = tmp_path / "worksheet.txt"
+    file.write_bytes(text.encode("ascii"))
+    expected = list(parser.columns_from_lines(iter(text.replace("\r", "").splitlines(True))))
+    for band_width in (1, 3, 4096):
+        assert list(parser.columns_from_file(file, band_width=band_width)) == expected
+        assert list(parser.columns_from_source(str(file), band_width=band_width)) == expected
+
+
+def test_columns_from_file_empty(tmp_path):
+    file = tmp_path / "empty.txt"
+    file.write_text("")
+    assert list(parser.columns_from_file(file)) == []
+
+
+def test_line_spans_across_chunks():
+    """Line offsets survive newlines (and CRLF pairs) split across read chunks."""
+    data = b"ab\r\ncde\n\nf"
+    spans = parser._line_spans(io.BytesIO(data), chunk_size=3)
+    assert spans == [(0, 2), (4, 3), (8, 0), (9, 1)]
+
+
+def test_problem_column_groups_yields_before_input_ends():
+    """A group is yielded as soon as its separator column arrives."""
+
+    def columns():
+        yield parser.Column(index=0, values=["1", "+"])
+        yield parser.Column(index=1, values=[" ", " "])
+        raise AssertionError("read past the first separator")
+
+    group = next(parser.problem_column_groups(columns()))
+    assert (group.start_column, group.end_column, group.width) == (0, 0, 1)
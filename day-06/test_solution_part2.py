@@ -210,3 +210,79 @@ class TestEdgeCases:
         worksheet = "1 2 3\n* + *\n"
         result = solve_worksheet(io.StringIO(worksheet))
         assert result == 6
+
+
+class TestParallelEvaluation:
+    """Tests for balanced products and process-pool evaluation."""
+
+    def test_product_tree_matches_left_fold(self):
+        """Balanced product equals the plain product for any operand count."""
+        import math
+
+        from common.arithmetic import product_tree
+
+        for count in range(6):
+            operands = [7**i + 3 for i in range(count)]
+            assert product_tree(operands) == math.prod(operands)
+
+    def test_evaluate_problems_keeps_order(self):
+        """Pool results come back in input order across batches."""
+        from .utils import evaluate_problems
+
+        problems = [
+            Problem(operands=[i, i + 1], operation="*" if i % 2 else "+", result=0)
+            for i in range(25)
+        ]
+        serial = [result for _, result in evaluate_problems(problems)]
+        pooled = list(evaluate_problems(problems, workers=2, batch_size=4))
+        assert [problem for problem, _ in pooled] == problems
+        assert [result for _, result in pooled] == serial
+
+    def test_evaluate_problems_under_spawn(self):
+        """Workers start cleanly with the spawn method (no fork of the parent)."""
+        import multiprocessing
+
+        from .utils import evaluate_problems
+
+        problems = [Problem(operands=[i, 3, 5], operation="*", result=0) for i in range(9)]
+        spawn = multiprocessing.get_context("spawn")
+        pooled = evaluate_problems(problems, workers=2, batch_size=2, mp_context=spawn)
+        assert [result for _, result in pooled] == [15 * i for i in range(9)]
+
+    def test_evaluate_problems_rejects_bad_sizes(self):
+        """Non-positive worker counts and batch sizes raise instead of skipping problems."""
+        from .solution_part2 import solve_both_parts
+        from .utils import evaluate_problems
+
+        worksheet = "123 328  51 64 \n 45 64  387 23 \n  6 98  215 314\n*   +   *   +  \n"
+        with pytest.raises(ValueError, match="batch_size"):
+            solve_worksheet(io.StringIO(worksheet), workers=2, batch_size=0)
+        with pytest.raises(ValueError, match="batch_size"):
+            solve_both_parts(io.StringIO(worksheet), workers=2, batch_size=0)
+        with pytest.raises(ValueError, match="workers"):
+            list(evaluate_problems([], workers=0))
+
+    def test_solve_worksheet_with_workers(self):
+        """Parallel solve gives the same grand total as the serial solve."""
+        worksheet = "123 328  51 64 \n 45 64  387 23 \n  6 98  215 314\n*   +   *   +  \n"
+        assert solve_worksheet(io.StringIO(worksheet), workers=2, batch_size=1) == 3263827
+
+
+class TestSolveBothParts:
+    """Tests for the single-pass dual-part solver."""
+
+    def test_example_both_parts(self):
+        """One pass returns both grand totals of the example."""
+        from .solution import solve_worksheet as solve_part1
+        from .solution_part2 import solve_both_parts
+
+        worksheet = "123 328  51 64 \n 45 64  387 23 \n  6 98  215 314\n*   +   *   +  \n"
+        expected = (solve_part1(io.StringIO(worksheet)), 3263827)
+        assert solve_both_parts(io.StringIO(worksheet)) == expected
+        assert solve_both_parts(io.StringIO(worksheet), workers=2, batch_size=1) == expected
+
+    def test_empty_worksheet(self):
+        """Empty input gives zero for both parts."""
+        from .solution_part2 import solve_both_parts
+
+        assert solve_both_parts(io.StringIO("")) == (0, 0)
@@ -0,0 +1,53 @@
+"""
+Unit tests for day-06/vectorized.py (NumPy character-array backend)
+"""
+
+import io
+
+import numpy as np
+import pytest
+
+from . import vectorized
+from .solution import solve_worksheet as solve_part1
+from .solution_part2 import solve_worksheet as solve_part2
+
+EXAMPLE = "123 328  51 64 \n 45 64  387 23 \n  6 98  215 314\n*   +   *   +  \n"
+
+
+def test_load_worksheet_array_pads_rows():
+    array = vectorized.load_worksheet_array(io.StringIO("12\n3\n+ \n"))
+    assert array.shape == (3, 2)
+    assert array.dtype == np.uint8
+    assert array[1].tobytes() == b"3 "
+
+
+def test_group_bounds():
+    array = vectorized.load_worksheet_array(io.StringIO(EXAMPLE))
+    assert vectorized.group_bounds(array) == [(0, 3), (4, 7), (8, 11), (12, 15)]
+    assert vectorized.group_bounds(np.zeros((0, 0), dtype=np.uint8)) == []
+
+
+def test_extract_block_problem_both_parts():
+    array = vectorized.load_worksheet_array(io.StringIO(EXAMPLE))
+    first = array[:, 0:3]
+    assert vectorized.extract_block_problem(first, part=1).operands == [123, 45, 6]
+    problem = vectorized.extract_block_problem(first, part=2)
+    assert problem.operands == [356, 24, 1]
+    assert (problem.operation, problem.result) == ("*", 8544)
+
+
+def test_solve_worksheet_matches_streaming_pipeline(tmp_path):
+    assert vectorized.solve_worksheet(io.StringIO(EXAMPLE)) == solve_part1(io.StringIO(EXAMPLE))
+    assert vectorized.solve_worksheet(io.StringIO(EXAMPLE), part=2) == 3263827
+    file = tmp_path / "worksheet.txt"
+    file.write_text(EXAMPLE)
+    assert vectorized.solve_worksheet(file, part=2) == solve_part2(str(file))
+
+
+def test_extract_block_problem_errors():
+    with pytest.raises(ValueError, match="No operation found"):
+        vectorized.solve_worksheet(io.StringIO("1\n2\n \n"))
+    with pytest.raises(ValueError, match="No operands found"):
+        vectorized.solve_worksheet(io.StringIO("  \n  \n+ \n"))
+    with pytest.raises(ValueError, match="at least 2 rows"):
+        vectorized.solve_worksheet(io.StringIO("+\n"))
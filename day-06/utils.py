@@ -5,14 +5,21 @@ Provides shared components between Part 1 and Part 2 solutions.
 This module contains:
 - Problem dataclass: Used by both Part 1 and Part 2
 - evaluate_problem: Evaluation logic shared by both parts
+- evaluate_problems: Serial or process-pool evaluation of a problem stream
 - Type aliases: Common type definitions
 
 Both Part 1 (vertical columns, left-to-right) and Part 2 (vertical columns, right-to-left)
 use the same data model and evaluation logic. Only the parsing/grouping logic differs.
 """
 
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
 from dataclasses import dataclass
-from typing import List
+from itertools import islice
+from multiprocessing.context import BaseContext
+from typing import Deque, Iterable, Iterator, List, Optional, Tuple
+
+from common.arithmetic import apply_operation, apply_operations
 
 # Type aliases
 Operands = List[int]
@@ -54,12 +61,53 @@ def evaluate_problem(problem: Problem) -> int:
     Raises:
         ValueError: If operation is not '+' or '*'
     """
-    if problem.operation == "+":
-        return sum(problem.operands)
-    elif problem.operation == "*":
-        result = 1
-        for operand in problem.operands:
-            result *= operand
-        return result
-    else:
-        raise ValueError(f"Unknown operation: {problem.operation}")
+    return apply_operation(problem.operands, problem.operation)
+
+
+def evaluate_problems(
+    problems: Iterable[Problem],
+    workers: int = 1,
+    batch_size: int = 256,
+    mp_context: Optional[BaseContext] = None,
+) -> Iterator[Tuple[Problem, int]]:
+    """
+    Evaluate a stream of problems, optionally across a process pool.
+
+    With workers > 1, problems are sent to a ProcessPoolExecutor in batches
+    of batch_size. At most 2 * workers batches are in flight, so the input is
+    still consumed lazily, and results come back in input order so callers
+    can reduce the grand total (and print progress) deterministically. The
+    worker is common.arithmetic.apply_operations, which child processes can
+    import under every start method.
+
+    Args:
+        problems: Problems to evaluate (their result field is ignored)
+        workers: Number of worker processes; 1 evaluates serially in-process
+        batch_size: Problems per task sent to a worker
+        mp_context: Multiprocessing context for the pool (default start method if None)
+
+    Yields:
+        (problem, result) pairs in input order
+
+    Raises:
+        ValueError: If workers or batch_size is below 1
+    """
+    if workers < 1 or batch_size < 1:
+        raise ValueError(f"workers and batch_size must be >= 1, got {workers} and {batch_size}")
+    if workers == 1:
+        for problem in problems:
+            yield problem, evaluate_problem(problem)
+        return
+
+    iterator = iter(problems)
+    with ProcessPoolExecutor(max_workers=workers, mp_context=mp_context) as pool:
+        pending: Deque[Tuple[List[Problem], Future]] = deque()
+        while batch := list(islice(iterator, batch_size)):
+            payload = [(problem.operands, problem.operation) for problem in batch]
+            pending.append((batch, pool.submit(apply_operations, payload)))
+            if len(pending) >= 2 * workers:
+                done_batch, future = pending.popleft()
+                yield from zip(done_batch, future.result(), strict=True)
+        while pending:
+            done_batch, future = pending.popleft()
+            yield from zip(done_batch, future.result(), strict=True)
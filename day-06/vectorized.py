@@ -0,0 +1,139 @@
+"""
+Vectorized NumPy backend for Day 6 - Cephalopod Math Worksheet Solver.
+
+Loads the whole worksheet as a (rows, width) uint8 character array instead of
+building a Column object per column:
+- Separator columns are found with one all(axis=0) reduction
+- Each problem is a column slice of the array
+- Part 1 operands are read from the slice's rows, Part 2 operands from its columns
+
+Problems are returned as the shared Problem dataclass and evaluated with
+evaluate_problem from utils.py, so results match the streaming pipeline.
+
+Example:
+    >>> import io
+    >>> worksheet = "12 34\\n56 78\\n*  + \\n"
+    >>> solve_worksheet(io.StringIO(worksheet))
+    784
+"""
+
+from pathlib import Path
+from typing import IO, Iterator, List, Tuple, Union
+
+import numpy as np
+
+from .utils import Problem, evaluate_problem
+
+SPACE = ord(" ")
+WHITESPACE = np.frombuffer(b" \t\x0b\x0c", dtype=np.uint8)
+OPERATIONS = (ord("+"), ord("*"))
+# Translation table deleting every byte that is not an ASCII digit
+NON_DIGITS = bytes(b for b in range(256) if not 48 <= b <= 57)
+
+
+def load_worksheet_array(source: Union[str, Path, IO]) -> np.ndarray:
+    """
+    Load a worksheet into a (rows, width) uint8 array, right-padding short rows with spaces.
+
+    Args:
+        source: File path (str or Path), or file-like object (IO)
+
+    Returns:
+        np.ndarray: Character codes, one row per worksheet line
+    """
+    if isinstance(source, (str, Path)):
+        with open(source, "rb") as f:
+            lines = [line.rstrip(b"\r\n") for line in f]
+    else:
+        lines = [line.rstrip("\r\n").encode("ascii") for line in source]
+
+    width = max((len(line) for line in lines), default=0)
+    array = np.full((len(lines), width), SPACE, dtype=np.uint8)
+    for row, line in enumerate(lines):
+        array[row, : len(line)] = np.frombuffer(line, dtype=np.uint8)
+    return array
+
+
+def group_bounds(array: np.ndarray) -> List[Tuple[int, int]]:
+    """
+    Find the [start, end) column ranges of all problems, left to right.
+
+    A column is a separator when every character in it is whitespace.
+
+    Args:
+        array: Worksheet array from load_worksheet_array
+
+    Returns:
+        List of (start, end) column slices, one per problem
+    """
+    is_separator = np.isin(array, WHITESPACE).all(axis=0)
+    # Pad with separators so every group has a rising and a falling edge
+    edges = np.diff(np.concatenate(([True], is_separator, [True])).astype(np.int8))
+    starts = np.flatnonzero(edges == -1)
+    ends = np.flatnonzero(edges == 1)
+    return list(zip(starts.tolist(), ends.tolist(), strict=True))
+
+
+def _operands(lines: np.ndarray) -> List[int]:
+    """Read one number per array row, keeping only its digits."""
+    operands = []
+    for line in lines:
+        digits = line.tobytes().translate(None, NON_DIGITS)
+        if digits:
+            operands.append(int(digits))
+    return operands
+
+
+def extract_block_problem(block: np.ndarray, part: int = 1) -> Problem:
+    """
+    Build the Problem held in one column slice of the worksheet array.
+
+    Part 1 reads each row (except the last) left to right as one operand;
+    Part 2 reads each column top to bottom as one operand, right to left.
+
+    Args:
+        block: (rows, group_width) slice of the worksheet array
+        part: 1 or 2
+
+    Returns:
+        Problem: The parsed problem with operands, operation, and result
+
+    Raises:
+        ValueError: If problem format is invalid (no operation found, etc.)
+    """
+    if block.shape[0] < 2:
+        raise ValueError("Problem must have at least 2 rows (operands and operation)")
+
+    operation_positions = np.flatnonzero(np.isin(block[-1], OPERATIONS))
+    if not len(operation_positions):
+        raise ValueError("No operation found in last row")
+    operation = chr(block[-1, operation_positions[0]])
+
+    digits = block[:-1]
+    operands = _operands(digits if part == 1 else digits.T[::-1])
+    if not operands:
+        raise ValueError("No operands found in problem")
+
+    problem = Problem(operands=operands, operation=operation, result=0)
+    problem.result = evaluate_problem(problem)
+    return problem
+
+
+def iter_problems(array: np.ndarray, part: int = 1) -> Iterator[Problem]:
+    """Yield the problems of a worksheet array, left to right."""
+    for start, end in group_bounds(array):
+        yield extract_block_problem(array[:, start:end], part)
+
+
+def solve_worksheet(source: Union[str, Path, IO], part: int = 1) -> int:
+    """
+    Solve a worksheet with the NumPy backend and return the grand total.
+
+    Args:
+        source: File path (str or Path) or file-like object (IO)
+        part: 1 (row-wise operands) or 2 (column-wise operands, right to left)
+
+    Returns:
+        int: Grand total (sum of all problem results)
+    """
+    return sum(problem.result for problem in iter_problems(load_worksheet_array(source), part))
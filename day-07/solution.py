@@ -8,6 +8,11 @@ Algorithm: Queue-based BFS with state tracking
 - Beams are represented as (row, col, direction) tuples
 - A visited set tracks processed states to prevent reprocessing and enable beam merging
 - Each splitter encounter counts as one split
+
+count_splits uses sweep_beams instead: since beams only ever move down, it
+keeps the active beam columns of one row as a bitset (a Python int) and
+derives each next row's splits and beams with bitwise operations, in
+O(rows x width / 64) word operations and no visited set.
 """
 
 from collections import deque
@@ -119,13 +124,68 @@ def simulate_beams(grid: list[str], start_pos: tuple[int, int]) -> int:
     return split_count
 
 
+def row_mask(row: str, chars: str, width: int) -> int:
+    """
+    Encode which columns of a row hold any of chars as a bitset (bit i = column i).
+
+    Args:
+        row: One grid row
+        chars: Characters to mark
+        width: Grid width; columns beyond the row's length are unmarked
+
+    Returns:
+        Integer bitset of matching columns
+    """
+    table = {ord(ch): "0" for ch in set(row)}
+    table.update({ord(ch): "1" for ch in chars})
+    bits = row[:width].translate(table)
+    return int(bits[::-1], 2) if bits else 0
+
+
+def sweep_beams(grid: list[str], start_pos: tuple[int, int]) -> int:
+    """
+    Count beam splits with a row-by-row bitset sweep (same result as simulate_beams).
+
+    Beams only move down, so the state of a row is just the set of columns
+    holding a beam. For every next row:
+    - beams over '^' split: hits = active & splitters (each hit counts once)
+    - beams over '.' or 'S' pass straight down: active & passable
+    - split beams continue from the neighbouring columns: (hits << 1) | (hits >> 1)
+    Beams over any other character stop, and beams shifted outside the grid
+    width are masked off.
+
+    Args:
+        grid: List of strings representing the manifold
+        start_pos: (row, col) tuple for the starting position 'S'
+
+    Returns:
+        Integer count of beam splits
+    """
+    if not grid:
+        return 0
+    width = len(grid[0])
+    in_bounds = (1 << width) - 1
+    start_row, start_col = start_pos
+    active = (1 << start_col) & in_bounds
+    split_count = 0
+
+    for row in grid[start_row + 1 :]:
+        if not active:
+            break
+        hits = active & row_mask(row, "^", width)
+        split_count += hits.bit_count()
+        active = (active & row_mask(row, ".S", width)) | (((hits << 1) | (hits >> 1)) & in_bounds)
+
+    return split_count
+
+
 def count_splits(filename: str) -> int:
     """
     Count the number of beam splits in a manifold diagram.
 
     This is the main entry point that:
     1. Parses the input file to extract the grid and starting position
-    2. Simulates beam movement and splitting
+    2. Sweeps beams down the grid row by row (sweep_beams)
     3. Returns the total split count
 
     Args:
@@ -135,7 +195,7 @@ def count_splits(filename: str) -> int:
         Integer count of beam splits
     """
     grid, start_pos = parse_grid(filename)
-    return simulate_beams(grid, start_pos)
+    return sweep_beams(grid, start_pos)
 
 
 if __name__ == "__main__":
@@ -1,8 +1,18 @@
+from functools import cached_property
 from typing import Literal
 
+import numpy as np
+
+from common.grid import Grid
 
 # --- Move class and type definitions above main() ---
 Coordinate = tuple[int, int]  # (row, col)
+# Grid character -> cell kind; ' ' covers blanks, short rows and out-of-bounds
+_CELL_KINDS: dict[str, str | None] = {"S": "start", "^": "splitter", ".": "empty", " ": None}
+# Same mapping indexed by byte value, for O(1) lookups on row bytes
+_KIND_BY_BYTE: tuple[str | None, ...] = tuple(_CELL_KINDS.get(chr(b)) for b in range(256))
+_ALLOWED_BYTES = "".join(_CELL_KINDS).encode("ascii")
+SPACE = ord(" ")
 
 
 class Cell:
@@ -12,93 +22,187 @@ class Cell:
 
 
 class ManifoldDiagram:
-    allowed_chars = {"S", "^", ".", " "}
+    """Validated manifold diagram.
+
+    The diagram is stored once, as a ' '-filled Grid (one byte per cell).
+    Cell kinds are a lookup on grid.cells, and a sorted array of splitter
+    columns per row (splitter_cols) is derived from the grid in one
+    vectorized pass; no per-cell Python objects are built. Row strings are
+    read from the grid on demand (row(r), or the cached rows list).
+    """
+
+    allowed_chars = set(_CELL_KINDS)
 
     def __init__(self, rows: list[str]):
-        self.rows = [row.rstrip() for row in rows]
-        self.height = len(self.rows)
-        self.width = max((len(row) for row in self.rows), default=0)
         self.start: Coordinate | None = None
-        self.splitters: set[Coordinate] = set()
-        self.walkable: set[Coordinate] = set()
-        self._parse()
-
-    def _parse(self):
-        found_start = False
-        for r, row in enumerate(self.rows):
-            for c, ch in enumerate(row):
-                if ch not in self.allowed_chars:
-                    raise ValueError(f"Invalid character '{ch}' at ({r},{c})")
-                if ch == "S":
-                    if found_start:
-                        raise ValueError("Multiple start positions 'S' found")
-                    self.start = (r, c)
-                    found_start = True
-                    self.walkable.add((r, c))
-                elif ch == "^":
-                    self.splitters.add((r, c))
-                    self.walkable.add((r, c))
-                elif ch == ".":
-                    self.walkable.add((r, c))
-        if not found_start:
+        self.splitter_cols: list[np.ndarray] = []
+        self.grid: Grid
+        self._parse([row.rstrip() for row in rows])
+        self.height = self.grid.height
+        self.width = self.grid.width
+
+    def _parse(self, rows: list[str]):
+        for r, row in enumerate(rows):
+            # Deleting every allowed byte leaves only invalid ones (C-level scan)
+            data = row.encode("ascii") if row.isascii() else b""
+            if len(data) != len(row) or data.translate(None, _ALLOWED_BYTES):
+                c = next(c for c, ch in enumerate(row) if ch not in self.allowed_chars)
+                raise ValueError(f"Invalid character '{row[c]}' at ({r},{c})")
+            starts = data.count(b"S")
+            if starts:
+                if starts > 1 or self.start is not None:
+                    raise ValueError("Multiple start positions 'S' found")
+                self.start = (r, data.index(b"S"))
+        if self.start is None:
             raise ValueError("No start position 'S' found in diagram")
-        if self.height == 0 or all(not row.strip() for row in self.rows):
+        if not rows or all(not row.strip() for row in rows):
             raise ValueError("Diagram must contain at least one non-whitespace row")
+        # Short rows and the border are filled with ' ', which is not walkable
+        self.grid = Grid(rows, fill=" ")
+        is_splitter = self.grid.to_array()[1:-1, 1:-1] == ord("^")
+        self.splitter_cols = [np.flatnonzero(row).astype(np.int32) for row in is_splitter]
+
+    def row(self, r: int) -> str:
+        """Row r without the trailing ' ' fill; O(width), read straight from the grid."""
+        grid = self.grid
+        return grid.cells[grid.index(r, 0) : grid.index(r, grid.width)].decode("ascii").rstrip()
+
+    @property
+    def row_bytes(self) -> list[bytes]:
+        """Every row's bytes without the trailing ' ' fill.
+
+        An O(cells) copy built on each access; use row(r) for a single row.
+        """
+        grid = self.grid
+        return [
+            bytes(grid.cells[grid.index(r, 0) : grid.index(r, grid.width)]).rstrip(b" ")
+            for r in range(grid.height)
+        ]
+
+    @cached_property
+    def rows(self) -> list[str]:
+        """Every row as a string without the trailing ' ' fill.
+
+        An O(cells) copy, decoded on first access and then cached, so
+        rows[r] in a loop stays O(1); use row(r) to avoid keeping the copy.
+        """
+        return [self.row(r) for r in range(self.height)]
+
+    def _byte_at(self, coord: Coordinate) -> int:
+        r, c = coord
+        if self.grid.in_bounds(r, c):
+            return self.grid.cells[self.grid.index(r, c)]
+        return SPACE
+
+    @property
+    def splitters(self) -> set[Coordinate]:
+        return {(r, c) for r, columns in enumerate(self.splitter_cols) for c in columns.tolist()}
+
+    @property
+    def walkable(self) -> set[Coordinate]:
+        return {self.grid.position(i) for ch in "S^." for i in self.grid.indices_of(ch)}
+
+    def is_walkable(self, coord: Coordinate) -> bool:
+        return self._byte_at(coord) != SPACE
 
     def cell_kind(self, coord: Coordinate) -> str | None:
-        if coord == self.start:
-            return "start"
-        elif coord in self.splitters:
-            return "splitter"
-        elif coord in self.walkable:
-            return "empty"
-        return None
+        return _KIND_BY_BYTE[self._byte_at(coord)]
 
 
-# --- MVP: Single Splitter Timeline Counter ---
+# --- Timeline Counter: bottom-up row DP ---
 def count_timelines(diagram: "ManifoldDiagram") -> int:
-    memo = {}
-
-    def in_bounds(coord):
-        r, c = coord
-        return 0 <= r < diagram.height and 0 <= c < diagram.width
-
-    def dfs(coord):
-        if coord in memo:
-            return memo[coord]
-        if not in_bounds(coord) or coord not in diagram.walkable:
-            return 0
-        if coord[0] == diagram.height - 1:
-            memo[coord] = 1
-            return 1
-        kind = diagram.cell_kind(coord)
-        if coord[0] == diagram.height - 1:
-            memo[coord] = 1
-            return 1
-        total = 0
-        kind = diagram.cell_kind(coord)
-        if kind == "splitter":
-            # Split diagonally left and right
-            for dcol in (-1, 1):
-                next_coord = (coord[0] + 1, coord[1] + dcol)
-                if in_bounds(next_coord) and next_coord in diagram.walkable:
-                    total += dfs(next_coord)
-        else:
-            # Only move straight down
-            next_coord = (coord[0] + 1, coord[1])
-            if in_bounds(next_coord) and next_coord in diagram.walkable:
-                total += dfs(next_coord)
-        # If no moves were possible, timeline ends here
-        if total == 0:
-            total = 1
-        memo[coord] = total
-        return total
-
-    return dfs(diagram.start)
+    """
+    Count the timelines a particle starting at 'S' can follow.
+
+    timelines(r, c) is 0 off the walkable cells, 1 on the last row, otherwise
+    the sum over the walkable cells below it (diagonally left and right for a
+    splitter, straight down otherwise), or 1 if none is walkable.
+
+    Rows are evaluated bottom-up, keeping one list of counts for the row below
+    (including the ' ' border of the grid, so no bounds checks). No recursion
+    and O(width) memory, so diagrams of any height are supported.
+    """
+    grid = diagram.grid
+    stride = grid.stride
+    space, splitter = SPACE, ord("^")
+
+    def padded_row(r: int) -> bytearray:
+        start = grid.index(r, -1)
+        return grid.cells[start : start + stride]
+
+    # Flat row index j holds column j - 1; j = 0 and j = stride - 1 are border
+    below = [0 if ch == space else 1 for ch in padded_row(diagram.height - 1)]
+    start_row, start_col = diagram.start
+    for r in range(diagram.height - 2, start_row - 1, -1):
+        current = [0] * stride
+        for j, ch in enumerate(padded_row(r)):
+            if ch == space:
+                continue
+            total = below[j - 1] + below[j + 1] if ch == splitter else below[j]
+            # If no moves were possible, timeline ends here
+            current[j] = total or 1
+        below = current
+    return below[start_col + 1]
+
+
+# --- Unified engine: splits and timelines in one top-down sweep ---
+def sweep_manifold(diagram: "ManifoldDiagram") -> tuple[int, int]:
+    """
+    Compute the Part 1 split count and the Part 2 timeline count in one pass.
+
+    Sweeps rows top-down keeping, per column, how many timelines are at that
+    cell (big ints). A timeline on a splitter moves diagonally down-left and
+    down-right, otherwise straight down; moves onto ' ' cells are dropped and
+    a timeline with no move left (or on the last row) ends. Every splitter
+    reached by at least one timeline is one Part 1 split.
+
+    Returns:
+        (split count, timeline count)
+    """
+    grid = diagram.grid
+    stride = grid.stride
+    space, splitter = SPACE, ord("^")
+
+    def padded_row(r: int) -> bytearray:
+        start = grid.index(r, -1)
+        return grid.cells[start : start + stride]
+
+    start_row, start_col = diagram.start
+    # Flat row index j holds column j - 1; j = 0 and j = stride - 1 are border
+    counts = [0] * stride
+    counts[start_col + 1] = 1
+    split_count = 0
+    finished = 0
+    for r in range(start_row, diagram.height):
+        row = padded_row(r)
+        last_row = r == diagram.height - 1
+        below = None if last_row else padded_row(r + 1)
+        next_counts = [0] * stride
+        for j in [j for j, count in enumerate(counts) if count]:
+            count = counts[j]
+            is_splitter = row[j] == splitter
+            split_count += is_splitter
+            if last_row:
+                finished += count
+                continue
+            targets = [t for t in ((j - 1, j + 1) if is_splitter else (j,)) if below[t] != space]
+            if not targets:
+                finished += count
+            for t in targets:
+                next_counts[t] += count
+        counts = next_counts
+    return split_count, finished
+
+
+def solve_both(path: str) -> tuple[int, int]:
+    """Parse a manifold file once and return (split count, timeline count)."""
+    with open(path, encoding="utf-8") as f:
+        rows = [line.rstrip("\n") for line in f]
+    return sweep_manifold(ManifoldDiagram(rows))
 
 
 # For test import
-__all__ = ["ManifoldDiagram", "count_timelines"]
+__all__ = ["ManifoldDiagram", "count_timelines", "solve_both", "sweep_manifold"]
 # Quantum Tachyon Manifold Timelines - Day 7 Part 2
 
 
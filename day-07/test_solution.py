@@ -10,7 +10,7 @@ Tests cover:
 
 import unittest
 
-from .solution import count_splits, parse_grid, simulate_beams
+from .solution import count_splits, parse_grid, row_mask, simulate_beams, sweep_beams
 
 
 class TestGridParsing(unittest.TestCase):
@@ -132,5 +132,41 @@ class TestEdgeCases(unittest.TestCase):
         self.assertEqual(result, 0)
 
 
+class TestBitsetSweep(unittest.TestCase):
+    """Test cases for the row-by-row bitset sweep."""
+
+    def test_row_mask(self):
+        """Test bit i of the mask marks column i."""
+        self.assertEqual(row_mask("^.^", "^", 3), 0b101)
+        self.assertEqual(row_mask(".S^", ".S", 3), 0b011)
+        self.assertEqual(row_mask("", "^", 3), 0)
+
+    def test_sweep_matches_bfs_on_examples(self):
+        """Test the sweep agrees with simulate_beams on the hand-written grids."""
+        grids = [
+            (["S", ".", "^", "."], (0, 0)),
+            (["S", ".", "^", ".", "^", "."], (0, 0)),
+            ([".S.", "...", ".^.", "..."], (0, 1)),
+            (["S", ".", "^"], (0, 0)),
+            (["S.^.^.."], (0, 0)),
+        ]
+        for grid, start_pos in grids:
+            self.assertEqual(sweep_beams(grid, start_pos), simulate_beams(grid, start_pos))
+
+    def test_sweep_matches_bfs_on_random_grids(self):
+        """Test the sweep agrees with simulate_beams on random manifolds."""
+        import random
+
+        rng = random.Random(7)
+        for _ in range(200):
+            width, height = rng.randint(1, 12), rng.randint(1, 12)
+            grid = ["".join(rng.choice("...^ ") for _ in range(width)) for _ in range(height)]
+            start_col = rng.randrange(width)
+            grid[0] = grid[0][:start_col] + "S" + grid[0][start_col + 1 :]
+            self.assertEqual(
+                sweep_beams(grid, (0, start_col)), simulate_beams(grid, (0, start_col))
+            )
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -49,3 +49,97 @@ def test_single_splitter():
     md = ManifoldDiagram(diagram)
     result = count_timelines(md)
     assert result == 2
+
+
+def test_tall_diagram_has_no_recursion_limit():
+    diagram = ["S"] + ["."] * 20000
+    md = ManifoldDiagram(diagram)
+    assert count_timelines(md) == 1
+
+
+def test_ragged_rows_and_blanks_stop_paths():
+    # Row 2 is shorter than the splitter's right branch: only the left branch continues
+    diagram = [".S", ".^", "."]
+    md = ManifoldDiagram(diagram)
+    assert count_timelines(md) == 1
+    # Blank below a straight path ends the timeline there
+    md = ManifoldDiagram(["S.", " .", ".."])
+    assert count_timelines(md) == 1
+
+
+def test_random_diagrams_match_path_enumeration():
+    import random
+
+    def enumerate_paths(rows, r, c):
+        def walkable(rr, cc):
+            return 0 <= rr < len(rows) and 0 <= cc < len(rows[rr]) and rows[rr][cc] != " "
+
+        if r == len(rows) - 1:
+            return 1
+        steps = (-1, 1) if rows[r][c] == "^" else (0,)
+        nexts = [(r + 1, c + d) for d in steps if walkable(r + 1, c + d)]
+        return sum(enumerate_paths(rows, *n) for n in nexts) if nexts else 1
+
+    rng = random.Random(41)
+    for _ in range(200):
+        width, height = rng.randint(1, 8), rng.randint(1, 8)
+        rows = ["".join(rng.choice("..^ ") for _ in range(width)) for _ in range(height)]
+        start_col = rng.randrange(width)
+        rows[0] = rows[0][:start_col] + "S" + rows[0][start_col + 1 :]
+        md = ManifoldDiagram(rows)
+        assert count_timelines(md) == enumerate_paths(md.rows, 0, start_col)
+
+
+def test_sweep_manifold_matches_both_parts():
+    import os
+    import random
+
+    from .solution import parse_grid, simulate_beams
+    from .solution_part2 import solve_both, sweep_manifold
+
+    path = os.path.join(os.path.dirname(__file__), "test_input.txt")
+    assert solve_both(path) == (21, 40)
+    grid, start_pos = parse_grid(path)
+    assert sweep_manifold(ManifoldDiagram(grid)) == (
+        simulate_beams(grid, start_pos),
+        count_timelines(ManifoldDiagram(grid)),
+    )
+
+    rng = random.Random(42)
+    for _ in range(200):
+        width, height = rng.randint(1, 8), rng.randint(1, 8)
+        rows = ["".join(rng.choice("...^") for _ in range(width)) for _ in range(height)]
+        start_col = rng.randrange(width)
+        rows[0] = rows[0][:start_col] + "S" + rows[0][start_col + 1 :]
+        md = ManifoldDiagram(rows)
+        expected = (simulate_beams(rows, (0, start_col)), count_timelines(md))
+        assert sweep_manifold(md) == expected
+
+
+def test_row_bytes_and_splitter_index():
+    md = ManifoldDiagram(["..S..", ".^.^.  ", "^", ""])
+    assert md.row_bytes == [b"..S..", b".^.^.", b"^", b""]
+    assert md.rows == ["..S..", ".^.^.", "^", ""] and md.rows is md.rows
+    assert [md.row(r) for r in range(md.height)] == md.rows
+    assert [cols.tolist() for cols in md.splitter_cols] == [[], [1, 3], [0], []]
+    assert md.splitters == {(1, 1), (1, 3), (2, 0)}
+    assert md.cell_kind((0, 2)) == "start"
+    assert md.cell_kind((1, 3)) == "splitter"
+    assert md.cell_kind((1, 4)) == "empty"
+    for coord in [(1, 5), (2, 1), (3, 0), (-1, 0), (0, -1), (4, 0)]:
+        assert md.cell_kind(coord) is None
+        assert not md.is_walkable(coord)
+
+
+def test_invalid_input_non_ascii_and_multiple_starts():
+    for rows, message in [
+        (["S.é"], "Invalid character 'é' at (0,2)"),
+        (["S.S"], "Multiple start positions"),
+        (["S..", ".S."], "Multiple start positions"),
+    ]:
+        try:
+            ManifoldDiagram(rows)
+        except ValueError as e:
+            assert message in str(e)
+        else:
+            raise AssertionError(f"Expected ValueError for {rows}")
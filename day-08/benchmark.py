@@ -0,0 +1,56 @@
+"""Benchmark scalar union() calls vs batched union_many() on random unions.
+
+Usage (from the day-08 directory):
+    uv run python benchmark.py [num_unions ...]
+"""
+
+import sys
+import time
+
+import numpy as np
+
+from common.union_find import UnionFind
+
+
+def random_pairs(num_unions: int, seed: int = 2025) -> tuple[np.ndarray, np.ndarray, int]:
+    """Random (a, b) element pairs over num_unions // 2 elements."""
+    rng = np.random.default_rng(seed)
+    n = max(2, num_unions // 2)
+    return rng.integers(0, n, num_unions), rng.integers(0, n, num_unions), n
+
+
+def time_scalar(a: np.ndarray, b: np.ndarray, n: int) -> tuple[int, float]:
+    """Union pair by pair and return (merges, elapsed seconds)."""
+    start = time.perf_counter()
+    uf = UnionFind(n)
+    union = uf.union
+    merges = sum(union(x, y) for x, y in zip(a.tolist(), b.tolist(), strict=True))
+    return merges, time.perf_counter() - start
+
+
+def time_batched(a: np.ndarray, b: np.ndarray, n: int, batch: int) -> tuple[int, float]:
+    """Union in batches of union_many and return (merges, elapsed seconds)."""
+    start = time.perf_counter()
+    uf = UnionFind(n)
+    merges = 0
+    for lo in range(0, len(a), batch):
+        merges += int(uf.union_many(a[lo : lo + batch], b[lo : lo + batch]).sum())
+    return merges, time.perf_counter() - start
+
+
+def main() -> None:
+    sizes = [int(arg) for arg in sys.argv[1:]] or [100_000, 1_000_000, 4_000_000]
+    print(f"{'unions':>10} {'merges':>10} {'scalar (s)':>11} {'batched (s)':>12} {'speedup':>8}")
+    for num_unions in sizes:
+        a, b, n = random_pairs(num_unions)
+        scalar_merges, scalar_time = time_scalar(a, b, n)
+        batched_merges, batched_time = time_batched(a, b, n, batch=1 << 18)
+        assert scalar_merges == batched_merges, (scalar_merges, batched_merges)
+        print(
+            f"{num_unions:>10} {batched_merges:>10} {scalar_time:>11.3f} {batched_time:>12.3f} "
+            f"{scalar_time / batched_time:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,200 @@
+"""Day 8 Part 2 via the Euclidean minimum spanning tree.
+
+Kruskal over all pairs (solution_part2.solve_part2) ends with the longest
+edge of the Euclidean MST. Computing the MST directly means the full edge
+list is never built:
+
+- prim_mst: Prim's algorithm on the implicit complete graph, one vectorized
+  O(n) distance update per added point: O(n^2) time, O(n) memory
+- delaunay_mst: Kruskal over the edges of the 3D Delaunay triangulation,
+  which contains an MST: O(n log n) for typical inputs
+
+Several pairs can share the longest MST length; last_connection settles such
+ties in the same (id_a, id_b) order as Kruskal, so the answer matches
+solve_part2 exactly.
+"""
+
+import math
+from collections.abc import Callable, Iterator
+from itertools import combinations
+
+import numpy as np
+from scipy.spatial import Delaunay, QhullError, cKDTree
+
+from common.union_find import UnionFind
+
+from .solution import parse_input
+
+# Minimum spanning tree edges: (id_a, id_b, squared length) arrays, id_a < id_b
+MstEdges = tuple[np.ndarray, np.ndarray, np.ndarray]
+NO_EDGE = np.iinfo(np.int64).max
+
+
+def _as_coords(points: list[tuple[int, int, int]]) -> np.ndarray:
+    return np.asarray(points, dtype=np.int64).reshape(len(points), 3)
+
+
+def _squared_to(coords: np.ndarray, point: int) -> np.ndarray:
+    """Exact int64 squared distances from coords[point] to every point."""
+    diff = coords - coords[point]
+    return np.einsum("ij,ij->i", diff, diff)
+
+
+def prim_mst(coords: np.ndarray) -> MstEdges:
+    """Minimum spanning tree of the complete graph with Prim's algorithm.
+
+    best[v] is the squared distance from v to the tree so far and via[v] the
+    tree point achieving it; each step adds the closest point and relaxes
+    best with that point's distance row.
+
+    Args:
+        coords: (n, 3) int64 point coordinates
+
+    Returns:
+        The n - 1 MST edges as (id_a, id_b, squared length) arrays
+    """
+    n = len(coords)
+    in_tree = np.zeros(n, dtype=bool)
+    best = np.full(n, NO_EDGE, dtype=np.int64)
+    via = np.zeros(n, dtype=np.int64)
+    tree_a, tree_b, lengths = [], [], []
+    point = 0
+    for step in range(n):
+        in_tree[point] = True
+        best[point] = NO_EDGE
+        if step:
+            tree_a.append(int(via[point]))
+            tree_b.append(point)
+        squared = _squared_to(coords, point)
+        closer = (squared < best) & ~in_tree
+        best[closer] = squared[closer]
+        via[closer] = point
+        if step < n - 1:
+            point = int(np.argmin(best))
+            lengths.append(int(best[point]))
+    a = np.array(tree_a, dtype=np.int64)
+    b = np.array(tree_b, dtype=np.int64)
+    return np.minimum(a, b), np.maximum(a, b), np.array(lengths, dtype=np.int64)
+
+
+def _kruskal(n: int, a: np.ndarray, b: np.ndarray, squared: np.ndarray) -> MstEdges | None:
+    """Kruskal over candidate edges; None if they do not connect all n points."""
+    order = np.lexsort((b, a, squared))
+    uf = UnionFind(n)
+    picked = order[uf.union_many(a[order], b[order])]
+    if not uf.is_fully_connected():
+        return None
+    return a[picked], b[picked], squared[picked]
+
+
+def delaunay_mst(coords: np.ndarray) -> MstEdges:
+    """Minimum spanning tree from the edges of the Delaunay triangulation.
+
+    Falls back to prim_mst for inputs Qhull cannot triangulate (fewer than
+    5 points, coplanar points) or when it leaves points out (duplicates).
+
+    Args:
+        coords: (n, 3) int64 point coordinates
+
+    Returns:
+        The n - 1 MST edges as (id_a, id_b, squared length) arrays
+    """
+    n = len(coords)
+    if n < 5:
+        return prim_mst(coords)
+    try:
+        simplices = Delaunay(coords.astype(np.float64)).simplices
+    except QhullError:
+        return prim_mst(coords)
+    ends = np.concatenate([simplices[:, [i, j]] for i, j in combinations(range(4), 2)])
+    keys = np.unique(ends.min(axis=1) * n + ends.max(axis=1))
+    a, b = np.divmod(keys, n)
+    diff = coords[a] - coords[b]
+    edges = _kruskal(n, a, b, np.einsum("ij,ij->i", diff, diff))
+    return prim_mst(coords) if edges is None else edges
+
+
+def tied_pairs_scan(coords: np.ndarray, squared: int) -> Iterator[tuple[int, int]]:
+    """Yield every pair at exactly the given squared distance, in (id_a, id_b) order.
+
+    One vectorized distance row per point: O(n^2) time, O(n) memory.
+    """
+    for a in range(len(coords) - 1):
+        for b in np.flatnonzero(_squared_to(coords, a)[a + 1 :] == squared).tolist():
+            yield a, a + 1 + b
+
+
+def tied_pairs_kdtree(coords: np.ndarray, squared: int) -> Iterator[tuple[int, int]]:
+    """Yield every pair at exactly the given squared distance, in (id_a, id_b) order.
+
+    Each point's KD-tree ball query, slightly above the length, finds its
+    candidates, which are then filtered on the exact integer squared distance.
+    Points are queried one at a time, so memory stays O(n) even when most
+    pairs fall inside the radius.
+    """
+    tree = cKDTree(coords)
+    radius = math.sqrt(squared) * (1 + 1e-9)
+    for a in range(len(coords) - 1):
+        b = np.array(tree.query_ball_point(coords[a], radius, return_sorted=True), dtype=np.int64)
+        b = b[b > a]
+        diff = coords[b] - coords[a]
+        yield from ((a, int(id_b)) for id_b in b[np.einsum("ij,ij->i", diff, diff) == squared])
+
+
+def last_connection(
+    coords: np.ndarray,
+    edges: MstEdges,
+    tied_pairs: Callable[[np.ndarray, int], Iterator[tuple[int, int]]] = tied_pairs_scan,
+) -> tuple[int, int]:
+    """Return the pair whose connection unifies all circuits in Kruskal order.
+
+    Every MST shares the same longest length W and the same components over
+    the edges shorter than W. Kruskal then scans the pairs of length W in
+    (id_a, id_b) order, and the last one that merges two components is the
+    answer.
+
+    Args:
+        coords: (n, 3) int64 point coordinates, n >= 2
+        edges: MST edges from prim_mst or delaunay_mst
+        tied_pairs: Generator of all pairs with a given squared length, in order
+
+    Returns:
+        (id_a, id_b) of the final connection
+    """
+    a, b, squared = edges
+    longest = int(squared.max())
+    uf = UnionFind(len(coords))
+    shorter = squared < longest
+    uf.union_many(a[shorter], b[shorter])
+    last = None
+    for id_a, id_b in tied_pairs(coords, longest):
+        if uf.union(id_a, id_b):
+            last = (id_a, id_b)
+    assert last is not None and uf.is_fully_connected()
+    return last
+
+
+def solve_part2_mst(input_data: str, method: str = "prim") -> int:
+    """Solve Part 2 from the Euclidean MST instead of sorting all pairs.
+
+    Args:
+        input_data: String containing junction box coordinates (one per line, X,Y,Z format)
+        method: "prim" (O(n^2), O(n) memory) or "delaunay" (triangulation + KD-tree)
+
+    Returns:
+        Product of X coordinates of the two boxes whose connection unified all circuits
+
+    Raises:
+        ValueError: If there are fewer than two junction boxes or method is unknown
+    """
+    points = parse_input(input_data)
+    if len(points) < 2:
+        raise ValueError("Circuit never unified - invalid input or logic error")
+    coords = _as_coords(points)
+    if method == "prim":
+        id_a, id_b = last_connection(coords, prim_mst(coords), tied_pairs_scan)
+    elif method == "delaunay":
+        id_a, id_b = last_connection(coords, delaunay_mst(coords), tied_pairs_kdtree)
+    else:
+        raise ValueError(f"Unknown MST method: {method!r}")
+    return points[id_a][0] * points[id_b][0]
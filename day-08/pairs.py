@@ -0,0 +1,227 @@
+"""Day 8: Closest-pair streams that avoid materializing every pair.
+
+compute_all_distances builds and sorts all n(n-1)/2 pairs, which is O(n^2)
+memory. The generators here yield the same (distance, id_a, id_b) tuples in
+the same order (ascending distance, ties by (id_a, id_b)), but lazily:
+
+- closest_pairs_knn: KD-tree k-nearest-neighbor candidates, doubling k
+  only when the consumer asks for pairs beyond the proven-complete prefix
+- closest_pairs_partitioned: condensed squared-distance vector, emitted in
+  doubling batches selected with np.partition (no full sort)
+- closest_pairs_sorted: the same vector (built in row blocks) ordered by a
+  single stable argsort; fastest when most pairs are consumed
+
+Ordering uses exact integer squared distances, so ties are never split by
+floating point rounding.
+"""
+
+import math
+from collections.abc import Iterator
+
+import numpy as np
+from scipy.spatial import cKDTree
+
+from .solution import DistancePair, JunctionBox
+
+
+def _squared_distances(coords: np.ndarray, a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Exact int64 squared distances between coords[a] and coords[b]."""
+    diff = coords[a] - coords[b]
+    return np.einsum("ij,ij->i", diff, diff)
+
+
+def condensed_squared_distances(coords: np.ndarray, block_elements: int = 1 << 20) -> np.ndarray:
+    """Exact int64 squared distances of all pairs i < j, in row-major (i, j) order.
+
+    Rows are broadcast against all points a block at a time, so the
+    temporaries hold about block_elements distances instead of n^2.
+
+    Example:
+        >>> condensed_squared_distances(np.array([[0, 0, 0], [3, 4, 0], [0, 0, 5]])).tolist()
+        [25, 25, 50]
+
+    Args:
+        coords: (n, 3) int64 point coordinates
+        block_elements: Approximate number of distances computed per block
+
+    Returns:
+        int64 array of length n(n-1)/2; pair (i, j) is at row_offsets(n)[i] + j - i - 1
+    """
+    n = len(coords)
+    offsets = row_offsets(n)
+    squared = np.empty(n * (n - 1) // 2, dtype=np.int64)
+    block_rows = max(1, block_elements // max(n, 1))
+    for start in range(0, n, block_rows):
+        stop = min(start + block_rows, n)
+        diff = coords[start:stop, None, :] - coords[None, :, :]
+        block = np.einsum("ijk,ijk->ij", diff, diff)
+        for i in range(start, stop):
+            squared[offsets[i] : offsets[i] + n - i - 1] = block[i - start, i + 1 :]
+    return squared
+
+
+def row_offsets(n: int) -> np.ndarray:
+    """Start of each row i's pairs (i, i+1..n-1) in a condensed vector."""
+    rows = np.arange(n, dtype=np.int64)
+    return rows * n - rows * (rows + 1) // 2
+
+
+def condensed_pairs(n: int, positions: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Decode condensed-vector positions into (id_a, id_b) arrays."""
+    offsets = row_offsets(n)
+    a = np.searchsorted(offsets, positions, side="right") - 1
+    return a, positions - offsets[a] + a + 1
+
+
+def sorted_pair_arrays(
+    points: list[JunctionBox], block_elements: int = 1 << 20
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Order all pairs by exact squared distance with one stable NumPy argsort.
+
+    The condensed vector is already in (id_a, id_b) order, so a stable sort
+    on squared distance yields compute_all_distances order, ties included.
+
+    Args:
+        points: Junction box coordinates
+        block_elements: Approximate number of distances computed per block
+
+    Returns:
+        (id_a, id_b, squared distances) arrays, ascending
+    """
+    n = len(points)
+    coords = np.asarray(points, dtype=np.int64).reshape(n, 3)
+    squared = condensed_squared_distances(coords, block_elements)
+    order = np.argsort(squared, kind="stable")
+    a, b = condensed_pairs(n, order)
+    return a, b, squared[order]
+
+
+def closest_pairs_sorted(points: list[JunctionBox]) -> Iterator[DistancePair]:
+    """Yield all pairs by ascending distance from sorted_pair_arrays."""
+    a, b, squared = sorted_pair_arrays(points)
+    for id_a, id_b, dist2 in zip(a.tolist(), b.tolist(), squared.tolist(), strict=True):
+        yield math.sqrt(dist2), id_a, id_b
+
+
+def knn_candidate_pairs(
+    tree: cKDTree, coords: np.ndarray, k: int
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, int | None]:
+    """Collect the unique pairs between each point and its k nearest neighbors.
+
+    A pair (i, j) closer than the farthest of i's returned neighbors is always
+    among i's returned neighbors, so every pair with squared distance below
+    the returned bound is guaranteed to be in the candidate set.
+
+    Args:
+        tree: cKDTree built over coords
+        coords: (n, 3) int64 point coordinates
+        k: Neighbors per point (excluding the point itself), at most n - 1
+
+    Returns:
+        (id_a, id_b, squared distances, bound) with id_a < id_b, sorted by
+        (squared distance, id_a, id_b); bound is None when k == n - 1 (all pairs)
+    """
+    n = len(coords)
+    _, neighbors = tree.query(coords, k=k + 1)
+    rows = np.repeat(np.arange(n), k + 1)
+    cols = neighbors.ravel()
+    farthest = _squared_distances(coords, rows, cols).reshape(n, k + 1).max(axis=1)
+    bound = None if k >= n - 1 else int(farthest.min())
+
+    keep = rows != cols
+    a = np.minimum(rows[keep], cols[keep])
+    b = np.maximum(rows[keep], cols[keep])
+    keys = np.unique(a * n + b)
+    a, b = np.divmod(keys, n)
+    squared = _squared_distances(coords, a, b)
+    order = np.lexsort((b, a, squared))
+    return a[order], b[order], squared[order], bound
+
+
+def closest_pairs_knn(points: list[JunctionBox], k: int = 8) -> Iterator[DistancePair]:
+    """Yield all pairs by ascending distance using a KD-tree, growing k lazily.
+
+    Each round queries k nearest neighbors per point (O(n k log n)) and yields
+    the candidates below the round's completeness bound. Only when the
+    consumer keeps iterating past that bound is k doubled and the tree queried
+    again, so taking the first few thousand pairs never touches the rest.
+
+    Example:
+        >>> next(closest_pairs_knn([(0, 0, 0), (9, 0, 0), (3, 4, 0)]))
+        (5.0, 0, 2)
+
+    Args:
+        points: Junction box coordinates
+        k: Initial number of neighbors per point
+
+    Yields:
+        (distance, id_a, id_b) tuples, id_a < id_b, in compute_all_distances order
+    """
+    n = len(points)
+    if n < 2:
+        return
+    coords = np.asarray(points, dtype=np.int64).reshape(n, 3)
+    tree = cKDTree(coords)
+    emitted_below = 0  # pairs with squared distance < emitted_below were yielded
+    k = max(1, k)
+    while True:
+        k = min(k, n - 1)
+        a, b, squared, bound = knn_candidate_pairs(tree, coords, k)
+        start = np.searchsorted(squared, emitted_below, side="left")
+        stop = len(squared) if bound is None else np.searchsorted(squared, bound, side="left")
+        window = slice(start, stop)
+        for id_a, id_b, dist2 in zip(
+            a[window].tolist(), b[window].tolist(), squared[window].tolist(), strict=True
+        ):
+            yield math.sqrt(dist2), id_a, id_b
+        if bound is None:
+            return
+        emitted_below = max(emitted_below, bound)
+        k *= 2
+
+
+def closest_pairs_partitioned(
+    points: list[JunctionBox], batch: int = 1024
+) -> Iterator[DistancePair]:
+    """Yield all pairs by ascending distance without fully sorting them.
+
+    Squared distances are computed for all pairs once (O(n^2)), then each
+    batch of the smallest remaining ones is selected with an O(remaining)
+    np.partition and only that batch is sorted. Batches double in size, so
+    consuming the first k pairs costs O(n^2 + k log k) and a consumer that
+    stops early (Part 2 once connected) never orders the rest.
+
+    Example:
+        >>> list(closest_pairs_partitioned([(0, 0, 0), (4, 0, 0), (0, 0, 3)]))
+        [(3.0, 0, 2), (4.0, 0, 1), (5.0, 1, 2)]
+
+    Args:
+        points: Junction box coordinates
+        batch: Number of pairs in the first batch
+
+    Yields:
+        (distance, id_a, id_b) tuples, id_a < id_b, in compute_all_distances order
+    """
+    n = len(points)
+    if n < 2:
+        return
+    coords = np.asarray(points, dtype=np.int64).reshape(n, 3)
+    squared = condensed_squared_distances(coords)
+    # Positions still to emit, ascending, i.e. in (id_a, id_b) order
+    remaining = np.arange(len(squared))
+    batch = max(1, batch)
+    while len(remaining):
+        values = squared[remaining]
+        if batch < len(remaining):
+            # Take every pair tied with the batch's largest distance as well
+            threshold = np.partition(values, batch - 1)[batch - 1]
+            selected = values <= threshold
+            chosen, remaining = remaining[selected], remaining[~selected]
+        else:
+            chosen, remaining = remaining, remaining[:0]
+        # A stable sort of (id_a, id_b)-ordered positions gives (distance, id_a, id_b) order
+        chosen = chosen[np.argsort(squared[chosen], kind="stable")]
+        a, b = condensed_pairs(n, chosen)
+        for id_a, id_b, dist2 in zip(a.tolist(), b.tolist(), squared[chosen].tolist(), strict=True):
+            yield math.sqrt(dist2), id_a, id_b
+        batch *= 2
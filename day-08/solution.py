@@ -2,14 +2,22 @@
 
 Solves Advent of Code 2025 Day 8 Part 1 by:
 1. Parsing 3D junction box coordinates from input
-2. Computing all pairwise Euclidean distances
-3. Connecting closest pairs using Union-Find algorithm
+2. Streaming the closest pairs from a KD-tree (pairs.py); compute_all_distances
+   is the all-pairs reference
+3. Connecting closest pairs using a size-tracking Union-Find
 4. Computing product of three largest circuit sizes
 """
 
+import heapq
 import math
+from bisect import bisect_left, insort
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from itertools import islice
 from pathlib import Path
 
+from common.union_find import UnionFind
+
 # Type aliases
 JunctionBox = tuple[int, int, int]  # (x, y, z) coordinates
 DistancePair = tuple[float, int, int]  # (distance, id_a, id_b)
@@ -87,10 +95,30 @@ def find_circuit(point_id: int, circuits: dict[str, set[int]]) -> str | None:
     return None
 
 
+def connect_closest_pairs(
+    sorted_distances: Iterable[DistancePair], num_points: int, num_connections: int
+) -> UnionFind:
+    """Union the endpoints of the num_connections closest pairs.
+
+    Args:
+        sorted_distances: (distance, id_a, id_b) tuples sorted by distance
+        num_points: Total number of junction boxes
+        num_connections: Number of closest pairs to process (including skipped pairs)
+
+    Returns:
+        UnionFind over all junction boxes after the connections
+    """
+    uf = UnionFind(num_points)
+    # Count attempts, not actual connections: pairs already in one circuit are no-ops
+    for _distance, point_a, point_b in islice(sorted_distances, num_connections):
+        uf.union(point_a, point_b)
+    return uf
+
+
 def process_connections(
-    sorted_distances: list[DistancePair], num_points: int, num_connections: int
+    sorted_distances: Iterable[DistancePair], num_points: int, num_connections: int
 ) -> dict[str, set[int]]:
-    """Process connections to build circuits using Union-Find approach.
+    """Process connections to build circuits using Union-Find.
 
     Args:
         sorted_distances: List of (distance, id_a, id_b) sorted by distance
@@ -98,39 +126,10 @@ def process_connections(
         num_connections: Number of closest pairs to process (including skipped pairs)
 
     Returns:
-        Dictionary of circuit_name -> set of point IDs
+        Dictionary of circuit_name -> set of point IDs (unconnected points are singletons)
     """
-    circuits: dict[str, set[int]] = {}
-    next_circuit_id = 0
-
-    # Process the N closest pairs (count attempts, not actual connections)
-    for _distance, point_a, point_b in sorted_distances[:num_connections]:
-        circuit_a = find_circuit(point_a, circuits)
-        circuit_b = find_circuit(point_b, circuits)
-
-        if circuit_a is None and circuit_b is None:
-            # Both unassigned: create new circuit
-            circuits[f"circuit_{next_circuit_id}"] = {point_a, point_b}
-            next_circuit_id += 1
-        elif circuit_a is not None and circuit_b is None:
-            # Point B joins circuit A
-            circuits[circuit_a].add(point_b)
-        elif circuit_a is None and circuit_b is not None:
-            # Point A joins circuit B
-            circuits[circuit_b].add(point_a)
-        elif circuit_a != circuit_b:
-            # Merge two circuits
-            circuits[circuit_a].update(circuits[circuit_b])
-            del circuits[circuit_b]
-        # else: both in same circuit, skip (but still counts as one of the N pairs processed)
-
-    # Add singleton circuits for unconnected points
-    for point_id in range(num_points):
-        if find_circuit(point_id, circuits) is None:
-            circuits[f"circuit_{next_circuit_id}"] = {point_id}
-            next_circuit_id += 1
-
-    return circuits
+    uf = connect_closest_pairs(sorted_distances, num_points, num_connections)
+    return {f"circuit_{root}": members for root, members in uf.components().items()}
 
 
 def get_three_largest_sizes(circuits: dict[str, set[int]]) -> list[int]:
@@ -142,36 +141,139 @@ def get_three_largest_sizes(circuits: dict[str, set[int]]) -> list[int]:
     Returns:
         List of three largest circuit sizes in descending order
     """
-    sizes = sorted([len(members) for members in circuits.values()], reverse=True)
-    return sizes[:3]
+    return heapq.nlargest(3, (len(members) for members in circuits.values()))
 
 
-def solve_part1(input_data: str, num_connections: int = 1000) -> int:
+def solve_part1(
+    input_data: str,
+    num_connections: int = 1000,
+    pair_stream: Callable[[list[JunctionBox]], Iterable[DistancePair]] | None = None,
+) -> int:
     """Solve Part 1 of the puzzle.
 
     Args:
         input_data: Input text containing junction box coordinates
         num_connections: Number of connections to make (default 1000)
+        pair_stream: Function yielding all pairs in ascending distance order
+            (default: pairs.closest_pairs_knn)
 
     Returns:
         Product of three largest circuit sizes
     """
+    from .pairs import closest_pairs_knn
+
     # Parse input
     points = parse_input(input_data)
 
-    # Compute all distances
-    distances = compute_all_distances(points)
+    # Only the closest num_connections pairs are needed, so never build all of them
+    pairs = (pair_stream or closest_pairs_knn)(points)
 
     # Build circuits
-    circuits = process_connections(distances, len(points), num_connections)
+    uf = connect_closest_pairs(pairs, len(points), num_connections)
 
     # Get three largest sizes
-    largest_three = get_three_largest_sizes(circuits)
+    largest_three = uf.largest_sizes(3)
 
     # Return product
     return largest_three[0] * largest_three[1] * largest_three[2]
 
 
+@dataclass(frozen=True, slots=True)
+class CircuitSnapshot:
+    """Circuit statistics after the first num_connections closest pairs."""
+
+    num_connections: int
+    num_circuits: int
+    largest_sizes: tuple[int, ...]  # Up to three, descending
+
+    @property
+    def largest_three_product(self) -> int:
+        """Product of the (up to) three largest circuit sizes, as in Part 1."""
+        return math.prod(self.largest_sizes)
+
+
+def circuit_snapshots(
+    sorted_distances: Iterable[DistancePair], num_points: int, checkpoints: Iterable[int]
+) -> list[CircuitSnapshot]:
+    """Record circuit statistics at many connection counts in one pass over the pairs.
+
+    Pairs are unioned in order exactly once. Sizes of non-singleton circuits
+    are kept in a sorted list (updated with bisect on every merge), so each
+    checkpoint reads the three largest sizes in O(1) instead of rescanning
+    every root. Once all boxes form one circuit, no further pairs are read
+    and the remaining checkpoints share the final state.
+
+    Args:
+        sorted_distances: (distance, id_a, id_b) tuples sorted by distance
+        num_points: Total number of junction boxes
+        checkpoints: Connection counts to snapshot (any order, duplicates allowed)
+
+    Returns:
+        One snapshot per distinct checkpoint, by ascending connection count;
+        counts beyond the available pairs see the state after all of them
+    """
+    uf = UnionFind(num_points)
+    multi_sizes: list[int] = []  # Sizes of circuits with 2+ boxes, ascending
+    singletons = num_points
+    # Descending, so the next checkpoint is popped from the end
+    pending = sorted(set(checkpoints), reverse=True)
+    snapshots: list[CircuitSnapshot] = []
+
+    pairs = iter(sorted_distances)
+    processed = 0
+    final = False
+    while pending:
+        if final or pending[-1] <= processed:
+            largest = (*reversed(multi_sizes[-3:]), *(1,) * min(3, singletons))
+            snapshots.append(CircuitSnapshot(pending.pop(), uf.num_components, largest[:3]))
+            continue
+        pair = None if uf.is_fully_connected() else next(pairs, None)
+        if pair is None:
+            # Connected or out of pairs: the remaining checkpoints share this state
+            final = True
+            continue
+        _distance, point_a, point_b = pair
+        processed += 1
+        root_a, root_b = uf.find(point_a), uf.find(point_b)
+        if root_a != root_b:
+            for size in (uf.size[root_a], uf.size[root_b]):
+                if size > 1:
+                    del multi_sizes[bisect_left(multi_sizes, size)]
+                else:
+                    singletons -= 1
+            uf.union(root_a, root_b)
+            insort(multi_sizes, uf.component_size(root_a))
+    return snapshots
+
+
+def sweep_part1(
+    input_data: str,
+    checkpoints: Iterable[int],
+    pair_stream: Callable[[list[JunctionBox]], Iterable[DistancePair]] | None = None,
+) -> list[CircuitSnapshot]:
+    """Answer Part 1 for many num_connections values with one pass over the pairs.
+
+    Example:
+        >>> points = "0,0,0\\n1,0,0\\n5,0,0\\n6,0,0\\n20,0,0"
+        >>> [s.largest_three_product for s in sweep_part1(points, [1, 2, 3])]
+        [2, 4, 4]
+
+    Args:
+        input_data: Input text containing junction box coordinates
+        checkpoints: num_connections values to evaluate
+        pair_stream: Function yielding all pairs in ascending distance order
+            (default: pairs.closest_pairs_knn)
+
+    Returns:
+        One CircuitSnapshot per distinct checkpoint, by ascending connection count
+    """
+    from .pairs import closest_pairs_knn
+
+    points = parse_input(input_data)
+    pairs = (pair_stream or closest_pairs_knn)(points)
+    return circuit_snapshots(pairs, len(points), checkpoints)
+
+
 def main():
     """Main entry point."""
     input_file = Path(__file__).parent / "input.txt"
@@ -1,78 +1,21 @@
 """Part 2 solution for AoC Day 8: Complete Circuit Formation.
 
-Reuses parsing and distance functions from Part 1 (solution.py).
+Reuses parsing from Part 1 (solution.py), the lazy closest-pair stream
+(pairs.py) and the shared common.union_find.UnionFind.
 """
 
-from .solution import compute_all_distances, parse_input
+from collections.abc import Callable, Iterable
 
+from common.union_find import UnionFind
 
-class UnionFind:
-    """Union-Find with path compression and union-by-rank for circuit tracking."""
+from .pairs import closest_pairs_knn
+from .solution import DistancePair, JunctionBox, parse_input
 
-    def __init__(self, n: int) -> None:
-        """Initialize Union-Find structure for n elements.
 
-        Args:
-            n: Number of elements (junction boxes)
-        """
-        self.parent = list(range(n))  # Each element is its own parent initially
-        self.rank = [0] * n  # Rank for union-by-rank optimization
-        self.num_components = n  # Track number of disjoint circuits
-
-    def find(self, x: int) -> int:
-        """Find root of element x with path compression.
-
-        Path compression: Make all nodes on path point directly to root.
-        This flattens the tree structure for O(α(n)) amortized time.
-
-        Args:
-            x: Element to find root of
-
-        Returns:
-            Root element of x's component
-        """
-        if self.parent[x] != x:
-            self.parent[x] = self.find(self.parent[x])  # Path compression
-        return self.parent[x]
-
-    def union(self, x: int, y: int) -> bool:
-        """Unite components containing x and y using union-by-rank.
-
-        Union-by-rank: Attach smaller tree under root of larger tree.
-        This keeps tree depth logarithmic for efficient future finds.
-
-        Args:
-            x: First element
-            y: Second element
-
-        Returns:
-            True if components were merged, False if already in same component
-        """
-        xroot = self.find(x)
-        yroot = self.find(y)
-        if xroot == yroot:
-            return False  # Already in same component
-        # Union-by-rank: attach smaller rank tree under higher rank tree
-        if self.rank[xroot] < self.rank[yroot]:
-            self.parent[xroot] = yroot
-        elif self.rank[xroot] > self.rank[yroot]:
-            self.parent[yroot] = xroot
-        else:
-            self.parent[yroot] = xroot
-            self.rank[xroot] += 1  # Same rank: increment after merge
-        self.num_components -= 1
-        return True
-
-    def is_fully_connected(self) -> bool:
-        """Check if all elements are in a single component.
-
-        Returns:
-            True if all elements form one connected component
-        """
-        return self.num_components == 1
-
-
-def solve_part2(input_data: str) -> int:
+def solve_part2(
+    input_data: str,
+    pair_stream: Callable[[list[JunctionBox]], Iterable[DistancePair]] = closest_pairs_knn,
+) -> int:
     """Find the connection that unifies all circuits.
 
     Processes junction box pairs by increasing Euclidean distance until all boxes
@@ -80,6 +23,7 @@ def solve_part2(input_data: str) -> int:
 
     Args:
         input_data: String containing junction box coordinates (one per line, X,Y,Z format)
+        pair_stream: Function yielding all pairs in ascending distance order
 
     Returns:
         Product of X coordinates of the two boxes whose connection unified all circuits
@@ -90,14 +34,12 @@ def solve_part2(input_data: str) -> int:
     # Parse junction box coordinates (reuse Part 1 parsing)
     points = parse_input(input_data)
 
-    # Compute all pairwise distances and sort by distance (reuse Part 1 distance logic)
-    distances = compute_all_distances(points)
-
     # Initialize UnionFind to track circuit membership
     uf = UnionFind(len(points))
 
-    # Process connections in distance order
-    for _dist, idx1, idx2 in distances:
+    # Process connections in distance order; the KD-tree stream stops growing
+    # its neighbor lists as soon as the final connection is found
+    for _dist, idx1, idx2 in pair_stream(points):
         # Check if boxes are already in same circuit (skip redundant connections)
         if uf.find(idx1) == uf.find(idx2):
             continue
@@ -0,0 +1,78 @@
+"""Tests for the Day 8 Part 2 MST engine."""
+
+import random
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from .mst import (
+    delaunay_mst,
+    last_connection,
+    prim_mst,
+    solve_part2_mst,
+    tied_pairs_kdtree,
+    tied_pairs_scan,
+)
+from .solution import compute_all_distances
+from .solution_part2 import solve_part2
+
+
+def random_input(seed: int, n: int, span: int) -> str:
+    """Random integer points as puzzle input; a small span produces many ties."""
+    rng = random.Random(seed)
+    return "\n".join(
+        f"{rng.randint(0, span)},{rng.randint(0, span)},{rng.randint(0, span)}" for _ in range(n)
+    )
+
+
+def mst_weight(edges) -> int:
+    return int(edges[2].sum())
+
+
+@pytest.mark.parametrize("method", ["prim", "delaunay"])
+def test_example_final_connection(method):
+    """Test example: final connection should produce 25272."""
+    input_data = (Path(__file__).parent / "test_input.txt").read_text()
+    assert solve_part2_mst(input_data, method) == 25272
+
+
+@pytest.mark.parametrize("method", ["prim", "delaunay"])
+@pytest.mark.parametrize("span", [1, 3, 1000])
+def test_matches_kruskal_with_ties(method, span):
+    """Test tied longest edges resolve to the same final pair as Kruskal."""
+    for seed in range(25):
+        input_data = random_input(seed, n=random.Random(seed).randint(2, 60), span=span)
+        assert solve_part2_mst(input_data, method) == solve_part2(input_data)
+
+
+def test_prim_and_delaunay_trees_have_equal_weight():
+    """Test both engines return spanning trees of minimum total weight."""
+    coords = np.array(
+        [tuple(map(int, line.split(","))) for line in random_input(3, 300, 10_000).split("\n")]
+    )
+    prim, delaunay = prim_mst(coords), delaunay_mst(coords)
+    assert len(prim[0]) == len(delaunay[0]) == 299
+    assert mst_weight(prim) == mst_weight(delaunay)
+    assert np.all(prim[0] < prim[1]) and np.all(delaunay[0] < delaunay[1])
+
+
+def test_tied_pairs_generators_agree():
+    """Test the scan and KD-tree tie finders list the same pairs in the same order."""
+    points = [(0, 0, 0), (1, 0, 0), (0, 1, 0), (1, 1, 0), (5, 5, 5)]
+    coords = np.array(points)
+    expected = [(a, b) for dist, a, b in compute_all_distances(points) if dist == 1.0]
+    assert list(tied_pairs_scan(coords, 1)) == expected
+    assert list(tied_pairs_kdtree(coords, 1)) == expected
+    lattice = np.array([(x, y, z) for x in range(4) for y in range(4) for z in range(4)])
+    for squared in (1, 2, 3, 27):
+        assert list(tied_pairs_kdtree(lattice, squared)) == list(tied_pairs_scan(lattice, squared))
+    assert last_connection(coords, prim_mst(coords)) == (3, 4)
+
+
+def test_invalid_inputs():
+    """Test single-point input and unknown methods are rejected."""
+    with pytest.raises(ValueError, match="never unified"):
+        solve_part2_mst("1,2,3")
+    with pytest.raises(ValueError, match="Unknown MST method"):
+        solve_part2_mst("1,2,3\n4,5,6", method="boruvka")
@@ -0,0 +1,118 @@
+"""Tests for Day 8 lazy closest-pair streams."""
+
+import random
+from itertools import islice
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from .pairs import (
+    closest_pairs_knn,
+    closest_pairs_partitioned,
+    closest_pairs_sorted,
+    condensed_pairs,
+    condensed_squared_distances,
+    sorted_pair_arrays,
+)
+from .solution import compute_all_distances, parse_input, solve_part1
+from .solution_part2 import solve_part2
+
+
+@pytest.fixture
+def example_input_text():
+    """Raw example input from test_input.txt."""
+    return (Path(__file__).parent / "test_input.txt").read_text()
+
+
+@pytest.fixture
+def example_points(example_input_text):
+    """Parsed example input from test_input.txt."""
+    return parse_input(example_input_text)
+
+
+def random_points(seed: int, n: int, span: int) -> list[tuple[int, int, int]]:
+    """Random integer points; a small span produces many tied distances."""
+    rng = random.Random(seed)
+    return [(rng.randint(0, span), rng.randint(0, span), rng.randint(0, span)) for _ in range(n)]
+
+
+def test_knn_stream_matches_full_sort(example_points):
+    """Test the KD-tree stream yields exactly compute_all_distances, in order."""
+    assert list(closest_pairs_knn(example_points)) == compute_all_distances(example_points)
+
+
+@pytest.mark.parametrize("span", [2, 10, 1000])
+@pytest.mark.parametrize("k", [1, 3, 8])
+def test_knn_stream_ties_and_growth(span, k):
+    """Test exact order with ties and duplicate points for every starting k."""
+    for seed in range(20):
+        points = random_points(seed, n=30, span=span)
+        assert list(closest_pairs_knn(points, k=k)) == compute_all_distances(points)
+
+
+def test_knn_stream_prefix(example_points):
+    """Test taking a prefix of the stream gives the closest pairs."""
+    first = list(islice(closest_pairs_knn(example_points, k=1), 10))
+    assert first == compute_all_distances(example_points)[:10]
+
+
+def test_knn_stream_small_inputs():
+    """Test empty, single-point and two-point inputs."""
+    assert list(closest_pairs_knn([])) == []
+    assert list(closest_pairs_knn([(1, 2, 3)])) == []
+    assert list(closest_pairs_knn([(0, 0, 0), (3, 4, 0)])) == [(5.0, 0, 1)]
+
+
+@pytest.mark.parametrize("span", [2, 10, 1000])
+@pytest.mark.parametrize("batch", [1, 5, 1024])
+def test_partitioned_stream_matches_full_sort(span, batch):
+    """Test batched selection keeps exact order, including ties across batch edges."""
+    for seed in range(20):
+        points = random_points(seed, n=30, span=span)
+        assert list(closest_pairs_partitioned(points, batch=batch)) == compute_all_distances(points)
+
+
+def test_partitioned_stream_prefix_and_small_inputs(example_points):
+    """Test stream prefixes and degenerate inputs."""
+    first = list(islice(closest_pairs_partitioned(example_points, batch=4), 10))
+    assert first == compute_all_distances(example_points)[:10]
+    assert list(closest_pairs_partitioned([])) == []
+    assert list(closest_pairs_partitioned([(1, 2, 3)])) == []
+
+
+def test_condensed_squared_distances_blocks():
+    """Test every block size gives the row-major condensed vector and pairs decode back."""
+    points = random_points(7, n=25, span=50)
+    coords = np.array(points, dtype=np.int64)
+    expected = [
+        (dist2, i, j)
+        for i in range(len(points))
+        for j in range(i + 1, len(points))
+        for dist2 in [sum((p - q) ** 2 for p, q in zip(points[i], points[j], strict=True))]
+    ]
+    for block_elements in [1, 30, 1 << 20]:
+        squared = condensed_squared_distances(coords, block_elements)
+        assert squared.dtype == np.int64
+        assert squared.tolist() == [dist2 for dist2, _, _ in expected]
+    a, b = condensed_pairs(len(points), np.arange(len(expected)))
+    assert list(zip(a.tolist(), b.tolist(), strict=True)) == [(i, j) for _, i, j in expected]
+
+
+@pytest.mark.parametrize("span", [2, 1000])
+def test_sorted_pairs_match_full_sort(span):
+    """Test the stable argsort order equals compute_all_distances, ties included."""
+    for seed in range(10):
+        points = random_points(seed, n=30, span=span)
+        assert list(closest_pairs_sorted(points)) == compute_all_distances(points)
+    a, b, squared = sorted_pair_arrays(random_points(1, n=30, span=span), block_elements=7)
+    assert np.all(np.diff(squared) >= 0) and np.all(a < b)
+
+
+@pytest.mark.parametrize(
+    "pair_stream", [closest_pairs_knn, closest_pairs_partitioned, closest_pairs_sorted]
+)
+def test_solvers_accept_every_stream(example_input_text, pair_stream):
+    """Test both parts give the example answers with each pair stream."""
+    assert solve_part1(example_input_text, num_connections=10, pair_stream=pair_stream) == 40
+    assert solve_part2(example_input_text, pair_stream=pair_stream) == 25272
@@ -4,13 +4,18 @@ from pathlib import Path
 
 import pytest
 from .solution import (
+    CircuitSnapshot,
+    UnionFind,
+    circuit_snapshots,
     compute_all_distances,
+    connect_closest_pairs,
     euclidean_distance,
     find_circuit,
     get_three_largest_sizes,
     parse_input,
     process_connections,
     solve_part1,
+    sweep_part1,
 )
 
 
@@ -207,6 +212,21 @@ def test_process_connections_example_10(example_input):
     assert sizes[1] >= 2  # Second largest should be at least 2
 
 
+def test_union_find_is_shared():
+    """Test the solution re-exports the shared UnionFind (covered in tests/)."""
+    from common.union_find import UnionFind as SharedUnionFind
+
+    assert UnionFind is SharedUnionFind
+
+
+def test_connect_closest_pairs_counts_attempts(example_input):
+    """Test the first N pairs are attempted even when they join one circuit."""
+    points = parse_input(example_input)
+    uf = connect_closest_pairs(iter(compute_all_distances(points)), len(points), 10)
+    assert uf.largest_sizes(3) == [5, 4, 2]
+    assert uf.num_components == 11  # [5, 4, 2, 2, 1, 1, 1, 1, 1, 1, 1]
+
+
 # ============================================================================
 # USER STORY 4: Calculate Circuit Sizes and Identify Largest Three
 # ============================================================================
@@ -250,3 +270,48 @@ def test_solve_part1_full_input():
 
     assert isinstance(result, int)
     assert result > 0
+
+
+# ============================================================================
+# Circuit snapshots for num_connections sweeps
+# ============================================================================
+
+
+def test_circuit_snapshots_match_recomputation(example_input):
+    """Test one pass gives the same statistics as rebuilding for every count."""
+    points = parse_input(example_input)
+    distances = compute_all_distances(points)
+    checkpoints = range(len(distances) + 3)
+    snapshots = circuit_snapshots(iter(distances), len(points), reversed(checkpoints))
+    assert [snapshot.num_connections for snapshot in snapshots] == list(checkpoints)
+    for snapshot in snapshots:
+        uf = connect_closest_pairs(distances, len(points), snapshot.num_connections)
+        assert snapshot.num_circuits == uf.num_components
+        assert list(snapshot.largest_sizes) == uf.largest_sizes(3)
+
+
+def test_circuit_snapshots_edge_states():
+    """Test the initial state, duplicate checkpoints and the fully connected state."""
+    distances = compute_all_distances([(0, 0, 0), (1, 0, 0), (5, 0, 0)])
+    snapshots = circuit_snapshots(distances, 3, [5, 0, 1, 1, 2])
+    assert snapshots == [
+        CircuitSnapshot(0, 3, (1, 1, 1)),
+        CircuitSnapshot(1, 2, (2, 1)),
+        CircuitSnapshot(2, 1, (3,)),
+        CircuitSnapshot(5, 1, (3,)),
+    ]
+    assert snapshots[1].largest_three_product == 2
+    assert circuit_snapshots([], 0, [0, 4]) == [
+        CircuitSnapshot(0, 0, ()),
+        CircuitSnapshot(4, 0, ()),
+    ]
+
+
+def test_sweep_part1_matches_solve_part1(example_input):
+    """Test sweep answers equal solve_part1 at each requested count."""
+    snapshots = sweep_part1(example_input, [10, 1, 12])
+    assert [snapshot.num_connections for snapshot in snapshots] == [1, 10, 12]
+    for snapshot in snapshots:
+        expected = solve_part1(example_input, num_connections=snapshot.num_connections)
+        assert snapshot.largest_three_product == expected
+    assert snapshots[1].largest_three_product == 40
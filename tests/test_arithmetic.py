@@ -0,0 +1,21 @@
+"""Tests for the shared operand arithmetic."""
+
+import math
+
+import pytest
+
+from common.arithmetic import apply_operation, apply_operations, product_tree
+
+
+def test_product_tree_matches_math_prod():
+    """Test the balanced product against a left fold for every operand count."""
+    for count in range(9):
+        operands = [3**i + 1 for i in range(count)]
+        assert product_tree(operands) == math.prod(operands)
+
+
+def test_apply_operations():
+    """Test sums, products and rejection of unknown operations."""
+    assert apply_operations([([1, 2, 3], "+"), ([4, 5], "*"), ([], "*")]) == [6, 20, 1]
+    with pytest.raises(ValueError, match="Unknown operation: -"):
+        apply_operation([1, 2], "-")
@@ -0,0 +1,57 @@
+"""Tests for the shared compact Grid."""
+
+import numpy as np
+
+from common.grid import Grid
+
+
+def test_grid_dimensions_and_padding():
+    """Test ragged rows are right-filled and the grid has a one-cell border."""
+    grid = Grid(["@.@", "@"], fill=" ")
+    assert (grid.height, grid.width, grid.stride) == (2, 3, 5)
+    assert len(grid.cells) == 4 * 5
+    assert grid[1, 0] == "@"
+    assert grid[1, 2] == " "
+    assert grid[-1, 0] == " "
+    assert grid[5, 5] == " "
+
+
+def test_grid_index_round_trip():
+    """Test flat index and (row, col) conversion are inverse."""
+    grid = Grid(["...", "...", "..."])
+    for row in range(-1, 4):
+        for col in range(-1, 4):
+            assert grid.position(grid.index(row, col)) == (row, col)
+
+
+def test_grid_neighbors_without_bounds_checks():
+    """Test neighbor counting at corners relies on the border."""
+    grid = Grid(["@@@", "@@@", "@@@"])
+    assert grid.count_neighbors(grid.index(0, 0), "@") == 3
+    assert grid.count_neighbors(grid.index(1, 1), "@") == 8
+    assert grid.count_neighbors(grid.index(2, 1), "@") == 5
+
+
+def test_grid_find_and_indices():
+    """Test character lookup in row-major order."""
+    grid = Grid([".S.", "^.^"])
+    assert grid.find("S") == (0, 1)
+    assert grid.find("#") is None
+    assert [grid.position(i) for i in grid.indices_of("^")] == [(1, 0), (1, 2)]
+
+
+def test_grid_to_array_is_view():
+    """Test the NumPy array shares the grid buffer."""
+    grid = Grid(["@.", ".@"])
+    array = grid.to_array()
+    assert array.shape == (4, 4)
+    assert np.array_equal(array[1:-1, 1:-1] == ord("@"), [[True, False], [False, True]])
+    grid.cells[grid.index(0, 1)] = ord("@")
+    assert array[1, 2] == ord("@")
+
+
+def test_grid_empty():
+    """Test an empty grid is only border."""
+    grid = Grid([])
+    assert (grid.height, grid.width) == (0, 0)
+    assert grid.to_array().shape == (2, 2)
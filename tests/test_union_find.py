@@ -0,0 +1,62 @@
+"""Tests for the shared array-backed UnionFind."""
+
+import random
+from array import array
+
+import numpy as np
+
+from common.union_find import UnionFind
+
+
+def test_union_by_size_and_queries():
+    """Test merges, component sizes, counts and the largest-size query."""
+    uf = UnionFind(6)
+    assert uf.union(0, 1)
+    assert uf.union(2, 3)
+    assert uf.union(1, 3)
+    assert not uf.union(0, 2)
+    assert (uf.component_size(2), uf.component_size(5)) == (4, 1)
+    assert uf.num_components == 3 and not uf.is_fully_connected()
+    assert uf.largest_sizes(3) == [4, 1, 1]
+    assert sorted(map(sorted, uf.components().values())) == [[0, 1, 2, 3], [4], [5]]
+    assert len(uf) == 6
+
+
+def test_find_is_iterative_on_long_chains():
+    """Test a 200k-long parent chain resolves without recursion and is compressed."""
+    n = 200_000
+    uf = UnionFind(n)
+    uf.parent = array("i", [0, *range(n - 1)])  # n-1 -> n-2 -> ... -> 0
+    assert uf.find(n - 1) == 0
+    assert all(parent == 0 for parent in uf.parent)
+
+
+def test_union_many_matches_sequential_unions():
+    """Test batched unions report the same merges as one union call per pair."""
+    for seed in range(200):
+        rng = random.Random(seed)
+        n = rng.randint(1, 40)
+        batched, sequential = UnionFind(n), UnionFind(n)
+        for _ in range(3):
+            a = [rng.randrange(n) for _ in range(rng.randint(0, 50))]
+            b = [rng.randrange(n) for _ in a]
+            expected = [sequential.union(x, y) for x, y in zip(a, b, strict=True)]
+            assert batched.union_many(a, b).tolist() == expected
+            assert batched.num_components == sequential.num_components
+            assert [batched.component_size(x) for x in range(n)] == [
+                sequential.component_size(x) for x in range(n)
+            ]
+            x, y = rng.randrange(n), rng.randrange(n)
+            assert batched.union(x, y) == sequential.union(x, y)
+
+
+def test_union_many_attaches_to_largest_root():
+    """Test a batch keeps the largest component's root as the merged root."""
+    uf = UnionFind(6)
+    uf.union_many(np.array([1, 1, 1]), np.array([2, 3, 4]))
+    root = uf.find(1)
+    merged = uf.union_many([0, 5], [4, 0])
+    assert merged.dtype == bool and merged.tolist() == [True, True]
+    assert uf.find(0) == uf.find(5) == root
+    assert uf.is_fully_connected()
+    assert uf.union_many([], []).tolist() == []